@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+import time
+
+from cortile import Cortile
+from cortile.base.connector import Connector
+from cortile.base.simulator import Simulator
+
+CLIENTS = 20
+METHODS = 2000
+
+
+def measure(clients: int = CLIENTS, methods: int = METHODS) -> None:
+    """
+    Measure method calls and event processing against the simulated cortile backend.
+
+    :param clients: Number of simulated clients, default is 20
+    :param methods: Number of executed methods, default is 2000
+    """
+    simulator = Simulator()
+    ct = Cortile(connector=Connector(session=simulator))
+    events = []
+    ct.listen(events.append)
+    for i in range(clients):
+        simulator.spawn(f'Client{i}')
+    simulator.flush(None)
+    events.clear()
+
+    start = time.perf_counter()
+    for i in range(methods):
+        ct.action_execute_cycle_next(0, 0)
+    simulator.flush(None)
+    elapsed = time.perf_counter() - start
+
+    print(f'methods: {methods / elapsed:9.0f} /s')
+    print(f'events:  {len(events) / elapsed:9.0f} /s')
+    ct.close()
+
+
+if __name__ == '__main__':
+    measure()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import compileall
+import statistics
+import subprocess
+
+RUNS = 20
+
+IMPORT = 'import time; t = time.perf_counter(); import cortile; print(time.perf_counter() - t)'
+CLASS = 'import time; t = time.perf_counter(); from cortile import Cortile; print(time.perf_counter() - t)'
+INIT = 'import time; t = time.perf_counter(); from cortile import Cortile; Cortile(); print(time.perf_counter() - t)'
+
+
+def measure(code: str, runs: int = RUNS) -> float:
+    """
+    Measure the median time of a statement in fresh interpreter processes.
+
+    :param code: Python code that prints the elapsed time in seconds
+    :param runs: Number of interpreter processes, default is 20
+
+    :return: Median time in milliseconds
+    """
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, check=True).stdout
+        times.append(float(output) * 1000)
+    return statistics.median(times)
+
+
+if __name__ == '__main__':
+    compileall.compile_dir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cortile'), quiet=1)
+    print(f'import cortile:        {measure(IMPORT):7.2f} ms')
+    print(f'from cortile import *: {measure(CLASS):7.2f} ms')
+    print(f'Cortile():             {measure(INIT):7.2f} ms')
@@ -1,6 +1,21 @@
 #!/usr/bin/env python3
 
-from cortile.cortile import Cortile
-
 __version__ = '1.0.1'
-__all__ = ['Cortile']
+__all__ = ['Cortile', 'AsyncCortile']
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the main classes on first access, to keep the package import fast.
+
+    :param name: Name of the module attribute
+
+    :return: Module attribute value
+    """
+    if name == 'Cortile':
+        from cortile.cortile import Cortile
+        return Cortile
+    if name == 'AsyncCortile':
+        from cortile.async_cortile import AsyncCortile
+        return AsyncCortile
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Tuple
+
+from cortile.cortile import Cortile
+from cortile.helper.dict import Dict
+from cortile.helper.logger import Logger
+from cortile.base.async_connector import AsyncConnector
+from cortile.base.batch import AsyncBatch
+
+
+class AsyncCortile(Cortile):
+    def __init__(self, log: int = Logger.LEVELS.WARN, connector: AsyncConnector | None = None):
+        """
+        Initialize the asynchronous cortile connector.
+        This main class provides the cortile interface for asyncio applications,
+        where all methods and getters are awaitable and events are received as async stream.
+
+        :param log: Logging level, default is warn
+        :param connector: Use an existing connector instead of creating a new one, default is None
+        """
+        self.connector = connector or AsyncConnector(log)
+
+    def events(self, *args: Tuple[str, ...]) -> AsyncIterator[Dict]:
+        """
+        Receive events as async stream.
+
+        :param args: Optional arguments to filter cortile event types
+
+        :return: Async iterator of cortile events
+        """
+        return self.connector.events(*args)
+
+    def refresh_async(self, name: str) -> asyncio.Task:
+        """
+        Fetch a property in the background and update the cache.
+
+        :param name: Name of the property, e.g. Clients or Windows
+
+        :return: Scheduled task on the running event loop
+        """
+        return self.connector.refresh_async(name)
+
+    async def wait(self) -> None:
+        """
+        Keeps the event stream running for registered listeners until disconnected.
+        """
+        async for _ in self.events():
+            pass
+        self.close()
+
+    @asynccontextmanager
+    async def batch(self, stop: bool = False) -> AsyncIterator['AsyncCortile']:
+        """
+        Queue method calls and execute them back to back when the context exits.
+        Queued methods are awaited as usual but return None, the per-call results are stored in batch.results afterwards.
+
+        :param stop: Stop on the first failed method, default is False
+
+        :return: Cortile instance that queues method calls
+        """
+        batch = AsyncCortile(connector=AsyncBatch(self.connector, stop))
+        batch.results = []
+        yield batch
+        batch.results = await batch.connector.dispatch()
+
+    async def get_active_layout(self) -> Dict | None:
+        """
+        Get the active layout for the current desktop and screen.
+
+        :return: Active layout with tiling enabled or None
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return None
+        async for layout in self.get_active_layouts():
+            if layout.Location.Desktop == workplace.CurrentDesktop and layout.Location.Screen == workplace.CurrentScreen:
+                return layout
+        return None
+
+    async def get_active_layouts(self) -> AsyncIterator[Dict]:
+        """
+        Get the active layouts from the workspaces.
+
+        :return: Async iterator of active layouts with tiling enabled
+        """
+        workspaces = await self.connector.property('Workspaces')
+        if not workspaces:
+            return
+        for workspace in workspaces.Values:
+            if workspace.Tiling:
+                yield workspace.Layouts[workspace.Layout]
+
+    async def get_active_client(self) -> Dict | None:
+        """
+        Get the current focused client window.
+
+        :return: Active client or None
+        """
+        clients = await self.get_clients()
+        windows = await self.get_windows()
+        for client in clients:
+            if windows and windows.Active.Id == client.Window.Id:
+                return client
+        return None
+
+    async def get_active_clients(self) -> AsyncIterator[Dict]:
+        """
+        Get information of clients on the current active screen.
+
+        :return: Async iterator of tracked clients on the current screen
+        """
+        clients = await self.connector.property('Clients')
+        workplace = await self.connector.property('Workplace')
+        if not clients or not workplace:
+            return
+        for client in clients.Values:
+            location = client.Latest.Location
+            if location.Desktop == workplace.CurrentDesktop and location.Screen == workplace.CurrentScreen:
+                yield client
+
+    async def get_active_desktop(self) -> int | None:
+        """
+        Get the current active desktop.
+
+        :return: Active desktop index or None
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return None
+        return workplace.CurrentDesktop
+
+    async def get_active_screen(self) -> int | None:
+        """
+        Get the current active screen.
+
+        :return: Active screen index or None
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return None
+        return workplace.CurrentScreen
+
+    async def get_desktop_count(self) -> int | None:
+        """
+        Get the number of desktops.
+
+        :return: Number of desktops or None
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return None
+        return workplace.DesktopCount
+
+    async def get_screen_count(self) -> int | None:
+        """
+        Get the number of screens.
+
+        :return: Number of screens or None
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return None
+        return workplace.ScreenCount
+
+    async def get_desktop_dimensions(self) -> List[Dict]:
+        """
+        Get the dimensions of all desktops.
+
+        :return: LTR sorted list of desktop dimensions
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return []
+        return workplace.Displays.Desktops
+
+    async def get_screen_dimensions(self) -> List[Dict]:
+        """
+        Get the dimensions of all screens.
+
+        :return: LTR sorted list of screen dimensions
+        """
+        workplace = await self.connector.property('Workplace')
+        if not workplace:
+            return []
+        return workplace.Displays.Screens
+
+    async def get_clients(self) -> List[Dict]:
+        """
+        Get all the clients information.
+
+        :return: List of tracked clients
+        """
+        clients = await self.connector.property('Clients')
+        if not clients:
+            return []
+        return clients.Values
+
+    async def get_clients_by_class(self, name: str) -> List[Dict]:
+        """
+        Get all the clients with a specific window class.
+
+        :param name: Case insensitive window class name
+
+        :return: List of tracked clients with the window class name
+        """
+        if not await self.connector.property('Clients'):
+            return []
+        return self.connector.index.classes(name)
+
+    async def get_windows(self) -> Dict | None:
+        """
+        Get all the windows information.
+
+        :return: List of tracked window ids or None
+        """
+        windows = await self.connector.property('Windows')
+        if not windows:
+            return None
+        return windows
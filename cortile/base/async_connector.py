@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from typing import AsyncIterator, Callable, List, Tuple
+
+from cortile.helper.dict import Dict
+from cortile.helper.logger import Logger
+from cortile.helper.sampler import Sampler
+from cortile.helper.buffer import Buffer
+from cortile.helper.recorder import Recorder
+from cortile.base.session import Session
+from cortile.base.index import Index
+from cortile.base.cache import Cache
+from cortile.base.delta import Delta
+from cortile.base.dispatcher import Dispatcher
+
+
+class AsyncConnector(object):
+    def __init__(self, log: int = Logger.LEVELS.WARN):
+        """
+        Initialize the asynchronous session connector.
+        This base class acts as a middle layer for asyncio applications, where cortile
+        methods and properties are coroutines and events are received from an async stream.
+        Registered callbacks are executed on the event loop while the stream is consumed.
+
+        :param log: Logging level, default is warn
+        """
+        self.log = Logger(log)
+        self.session = Session(log=self.log)
+        self.cache = Cache()
+        self.index = Index()
+        self.listener = []
+        self.debounces = Dict()
+        self.snapshots = Dict()
+        self.dispatcher = None
+        self.queue = None
+        self.recorder = None
+        self.processes = []
+        self.closed = asyncio.Event()
+        result = self.session.connect()
+        if result.Type == 'Result' and result.Data.Success:
+            self.log.info('Init: Connection established')
+        if result.Type == 'Error':
+            self.log.fatal('Error: %s', result.Data.Message)
+
+    @property
+    def properties(self) -> Dict:
+        """
+        Cached properties received from the event stream or property calls.
+
+        :return: Dictionary with cached property data
+        """
+        return self.cache.values
+
+    @property
+    def connected(self) -> bool:
+        """
+        Flag that indicates if session.connect() was successful.
+
+        :return: True if cortile binary is running, False otherwise
+        """
+        return self.session.connected and not self.closed.is_set()
+
+    def close(self) -> None:
+        """
+        Close the connection gracefully.
+        """
+        self.log.info('Close connection: %s', self.session.file)
+        self.session.disconnect()
+        for process in self.processes:
+            if process.returncode is None:
+                process.terminate()
+        for debounce in self.debounces.values():
+            if debounce.Handle is not None:
+                debounce.Handle.cancel()
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown()
+        if self.queue is not None:
+            self.queue.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        self.closed.set()
+        self.log.flush(1.0)
+
+    def listen(self, callback: Callable[[Dict], None], *events: Tuple[str, ...], sampler: Sampler | None = None) -> None:
+        """
+        Register a callback that is executed for events of the stream.
+        Coroutine functions are scheduled as tasks on the event loop.
+
+        :param callback: Callback function for cortile action events
+        :param events: Names of cortile events, default is all events
+        :param sampler: Sampling policy applied to the events, default is None
+        """
+        self.log.info('Register listener: %s', ' '.join(events) or len(self.listener))
+        self.listener.append((callback, set(events), sampler))
+
+    def debounce(self, name: str, delay: float, limit: float | None = None) -> None:
+        """
+        Coalesce bursts of events with the same name into the latest event for callbacks.
+        The property cache and the event stream still receive every event.
+
+        :param name: Name of the cortile event
+        :param delay: Time in seconds without new events until callbacks are executed
+        :param limit: Maximum time in seconds an event can be delayed, default is None
+        """
+        self.log.info('Debounce: %s %ss', name, delay)
+        previous = self.debounces.get(name)
+        if previous is not None and previous.Handle is not None:
+            previous.Handle.cancel()
+        self.debounces[name] = Dict(Delay=delay, Limit=limit, Value=None, Start=0.0, Handle=None)
+
+    def pool(self, workers: int = 4, size: int = 1024, policy: str = 'block') -> Dispatcher:
+        """
+        Execute callbacks in a thread pool instead of the event loop.
+        Events of each callback are still processed in order and further calls replace the existing pool.
+
+        :param workers: Number of worker threads, default is 4
+        :param size: Maximum number of queued events, default is 1024
+        :param policy: Overflow policy, block the event loop or drop the event, default is block
+
+        :return: Dispatcher instance with queue statistics
+        """
+        self.log.info('Pool: %d workers', workers)
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown()
+        self.dispatcher = Dispatcher(workers, size, policy, log=self.log)
+        return self.dispatcher
+
+    def buffer(self, size: int = 256, policy: str = 'block') -> Buffer:
+        """
+        Buffer raw events between reading the listener process and event processing.
+        The listener process is read by a separate task, while events are processed.
+
+        :param size: Maximum number of buffered events, default is 256
+        :param policy: Overflow policy, one of block, drop-oldest, drop-newest or coalesce, default is block
+
+        :return: Buffer instance with queue statistics
+        """
+        self.log.info('Buffer: %d events', size)
+        if self.queue is not None and not self.queue.closed:
+            self.queue.configure(size, policy)
+            return self.queue
+        self.queue = Buffer(size, policy)
+        return self.queue
+
+    def record(self, path: str, size: int = 64 * 1024 * 1024, count: int = 5) -> Recorder:
+        """
+        Record raw events of the listener process to a compressed json lines file.
+
+        :param path: Path of the recording file, e.g. events.jsonl.gz
+        :param size: Maximum uncompressed bytes per file before rotation, default is 64 MiB
+        :param count: Number of rotated files that are kept, default is 5
+
+        :return: Recorder instance with recording statistics
+        """
+        self.log.info('Record: %s', path)
+        if self.recorder is not None:
+            self.recorder.close()
+        self.recorder = Recorder(path, size, count)
+        return self.recorder
+
+    async def method(self, name: str, *args: Tuple[str, ...]) -> bool:
+        """
+        Execute cortile method with arguments.
+
+        :param name: Name of the cortile method
+        :param args: Arguments of the cortile method
+
+        :return: True if successful, False otherwise
+        """
+        if self.log.enabled('INFO'):
+            self.log.info('Method: %s %s', name, ' '.join(map(str, args)))
+        result = await self.execute('-method', name, *args)
+        if result.Type == 'Error':
+            self.log.error('Error: %s', result.Data.Message)
+        return result.Type == 'Result' and result.Data.Success
+
+    async def batch(self, calls: List[List[object]], stop: bool = False) -> List[bool | None]:
+        """
+        Execute multiple cortile methods one after another.
+
+        :param calls: List of method calls, each with method name and arguments
+        :param stop: Stop on the first failed method, default is False
+
+        :return: List with True if successful, False otherwise and None if skipped
+        """
+        results = [None] * len(calls)
+        for i, (name, *args) in enumerate(calls):
+            results[i] = await self.method(name, *args)
+            if stop and not results[i]:
+                break
+        return results
+
+    async def property(self, name: str, cached: bool = True) -> Dict | None:
+        """
+        Retrieve cortile property.
+
+        :param name: Name of the cortile property
+        :param cached: Use the cached value if it is not older than the maximum age of the property, default is True
+
+        :return: Dictionary with success data or None
+        """
+        self.log.info('Property: %s', name)
+        if cached:
+            data = self.cache.get(name)
+            if data is not None:
+                return data
+        result = await self.execute('-property', name)
+        if result.Type == 'Error':
+            self.log.error('Error: %s', result.Data.Message)
+        if result.Type == 'Property':
+            self.store(name, result.Data, result.Time)
+        return self.properties.get(name)
+
+    def expire(self, name: str, age: float | None) -> None:
+        """
+        Set the maximum age of a cached property, older values are fetched again.
+
+        :param name: Name of the cortile property
+        :param age: Maximum age in seconds or None to disable expiration
+        """
+        self.cache.expire(name, age)
+
+    def refresh_async(self, name: str) -> asyncio.Task:
+        """
+        Fetch a cortile property in the background and update the cache.
+
+        :param name: Name of the cortile property
+
+        :return: Scheduled task
+        """
+        self.cache.stats.Refreshes += 1
+        return asyncio.ensure_future(self.property(name, False))
+
+    async def help(self) -> str:
+        """
+        Show the help message from cortile dbus -help.
+
+        :return: String with help message output
+        """
+        return (await self.execute('-help')).Data.Message
+
+    async def events(self, *args: Tuple[str, ...]) -> AsyncIterator[Dict]:
+        """
+        Listen asynchronously to cortile events.
+
+        :param args: Optional arguments to filter cortile event types
+
+        :return: Async iterator of cortile events
+        """
+        if not self.connected:
+            return
+        for source in dict.fromkeys(Delta.SOURCES[name] for _, events, _ in self.listener for name in events if name in Delta.SOURCES):
+            if source not in self.snapshots:
+                await self.seed(source)
+        process = await asyncio.create_subprocess_exec(
+            self.session.file, 'dbus', '-listen', *map(str, args),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=2**24
+        )
+        self.processes.append(process)
+        queue = self.queue
+        if queue is not None and queue.closed:
+            queue = self.queue = Buffer(queue.size, queue.policy)
+        reader = asyncio.ensure_future(self.fill(process, queue)) if queue is not None else None
+        try:
+            while not self.closed.is_set():
+                if queue is None:
+                    stdout = await process.stdout.readline()
+                else:
+                    item = await asyncio.get_running_loop().run_in_executor(None, queue.pop)
+                    stdout = item if item is not None else b''
+                if not stdout:
+                    break
+                if self.recorder is not None and queue is None:
+                    self.recorder.write(stdout.rstrip(b'\n'))
+                result = self.session.parse(stdout, b'', 0)
+                self.callbacks(result)
+                yield result
+        finally:
+            if reader is not None:
+                reader.cancel()
+                queue.close()
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+            self.processes.remove(process)
+
+    async def fill(self, process: asyncio.subprocess.Process, queue: Buffer) -> None:
+        """
+        Internal function to read raw events from the listener process into the buffer.
+        The buffer is closed once the listener process exits and all events are processed.
+
+        :param process: Listener process
+        :param queue: Buffer with raw events
+        """
+        loop = asyncio.get_running_loop()
+        async for stdout in process.stdout:
+            stdout = stdout.rstrip(b'\n')
+            if self.recorder is not None:
+                self.recorder.write(stdout)
+            if queue.policy == 'block':
+                await loop.run_in_executor(None, queue.push, stdout)
+                continue
+            name = Sampler.peek(stdout)
+            queue.push(stdout, name if queue.policy == 'coalesce' else None, name == 'Disconnect')
+        while queue.stats.Depth and not queue.closed:
+            await asyncio.sleep(0.01)
+        queue.close()
+
+    async def execute(self, *args: Tuple[str, ...]) -> Dict:
+        """
+        Internal function to run the cortile dbus client as asynchronous subprocess.
+
+        :param args: Arguments of the cortile dbus client
+
+        :return: Dictionary with success or error data
+        """
+        if not self.session.connected:
+            return self.session.data('Error', Message='Not connected')
+        process = await asyncio.create_subprocess_exec(
+            self.session.file, 'dbus', *map(str, args),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return self.session.parse(stdout, stderr, process.returncode)
+
+    def observe(self, result: Dict) -> None:
+        """
+        Internal function to update cached properties or disconnect client.
+
+        :param result: Dictionary with success or error data
+        """
+        if result.Type != 'Property':
+            return
+        if result.Name == 'Disconnect':
+            return self.close()
+        self.log.info('%s: %s update', result.Type, result.Name)
+        self.store(result.Name, result.Data, result.Time)
+        if not self.delta(result.Name):
+            self.snapshots.pop(result.Name, None)
+            return
+        previous = self.snapshots.get(result.Name)
+        if previous is not None and result.Time < previous.Time:
+            return
+        self.snapshots[result.Name] = result
+        if previous is None:
+            return
+        for event in Delta.compare(result, previous.Data):
+            self.callbacks(event)
+
+    async def seed(self, name: str) -> None:
+        """
+        Internal function to fetch the first snapshot of a property that synthetic delta events are compared with.
+        Snapshots are only advanced by listener events, so fetched or refreshed properties don't hide changes.
+
+        :param name: Name of the cortile property
+        """
+        result = await self.execute('-property', name)
+        if result.Type == 'Error':
+            return self.log.error('Error: %s', result.Data.Message)
+        self.store(name, result.Data, result.Time)
+        self.snapshots.setdefault(name, result)
+
+    def delta(self, name: str) -> bool:
+        """
+        Internal function to check if synthetic delta events of a property are subscribed.
+
+        :param name: Name of the cortile property
+
+        :return: True if delta events are subscribed, False otherwise
+        """
+        return any(source == name and event in events for _, events, _ in self.listener for event, source in Delta.SOURCES.items())
+
+    def store(self, name: str, data: Dict, ts: int | None = None) -> bool:
+        """
+        Internal function to update a cached property and its index.
+
+        :param name: Name of the cortile property
+        :param data: Data of the cortile property
+        :param ts: Unix timestamp in milliseconds of the property, default is now
+
+        :return: True if the property was stored, False if it was older than the cached one
+        """
+        if not self.cache.set(name, data, ts):
+            return False
+        self.index.update(name, data)
+        return True
+
+    def callbacks(self, result: Dict) -> None:
+        """
+        Internal function to update the cache and pass an event to debounced or registered callbacks.
+
+        :param result: Dictionary with success or error data
+        """
+        self.observe(result)
+        debounce = self.debounces.get(result.Name)
+        if debounce is None:
+            return self.notify(result)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if debounce.Handle is None:
+            debounce.Start = now
+        else:
+            debounce.Handle.cancel()
+        deadline = now + debounce.Delay
+        if debounce.Limit is not None:
+            deadline = min(deadline, debounce.Start + debounce.Limit)
+        debounce.Value = result
+        debounce.Handle = loop.call_at(deadline, self.release, result.Name)
+
+    def release(self, name: str) -> None:
+        """
+        Internal function to pass the latest debounced event to registered callbacks.
+
+        :param name: Name of the cortile event
+        """
+        debounce = self.debounces[name]
+        result, debounce.Value, debounce.Handle = debounce.Value, None, None
+        self.notify(result)
+
+    def notify(self, result: Dict) -> None:
+        """
+        Internal function to execute registered callbacks that match the event name and sampling policy.
+
+        :param result: Dictionary with success or error data
+        """
+        for callback, events, sampler in self.listener:
+            if events and result.Name not in events:
+                continue
+            if sampler is not None and not sampler.accept(lambda: result):
+                continue
+            self.execute_callback(callback, result)
+
+    def execute_callback(self, callback: Callable[[Dict], None], result: Dict) -> None:
+        """
+        Internal function to execute a callback on the event loop, as task or in the thread pool.
+
+        :param callback: Callback function for cortile events
+        :param result: Dictionary with success or error data
+        """
+        if not callable(callback):
+            return
+        if asyncio.iscoroutinefunction(callback):
+            asyncio.ensure_future(callback(result))
+        elif self.dispatcher is not None:
+            self.dispatcher.submit(callback, result)
+        else:
+            callback(result)
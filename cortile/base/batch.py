@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+from typing import List, Tuple, TYPE_CHECKING
+
+from cortile.base.connector import Connector
+
+if TYPE_CHECKING:
+    from cortile.base.async_connector import AsyncConnector
+
+
+class Batch(object):
+    def __init__(self, connector: Connector, stop: bool = False):
+        """
+        Initialize the batch connector.
+        This base class queues cortile method calls instead of executing them and
+        dispatches all of them together, while other calls are passed to the connector.
+
+        :param connector: Connector used to dispatch the queued methods
+        :param stop: Stop on the first failed method, default is False
+        """
+        self.connector = connector
+        self.stop = stop
+        self.calls = []
+        self.results = []
+
+    def __getattr__(self, key: str) -> object:
+        """
+        Get attribute from the underlying connector.
+
+        :param key: Connector attribute key
+
+        :return: Connector attribute value
+        """
+        return getattr(self.connector, key)
+
+    def method(self, name: str, *args: Tuple[str, ...]) -> None:
+        """
+        Queue cortile method with arguments.
+
+        :param name: Name of the cortile method
+        :param args: Arguments of the cortile method
+        """
+        self.calls.append([name, *args])
+
+    def dispatch(self) -> List[bool | None]:
+        """
+        Execute all queued cortile methods back to back.
+
+        :return: List with True if successful, False otherwise and None if skipped
+        """
+        calls, self.calls = self.calls, []
+        self.results = self.connector.batch(calls, self.stop) if calls else []
+        return self.results
+
+
+class AsyncBatch(Batch):
+    def __init__(self, connector: 'AsyncConnector', stop: bool = False):
+        """
+        Initialize the asynchronous batch connector.
+        This helper class queues cortile method calls like the batch connector,
+        where queued methods and the dispatch are awaitable for the asynchronous interface.
+
+        :param connector: Asynchronous connector used to dispatch the queued methods
+        :param stop: Stop on the first failed method, default is False
+        """
+        super().__init__(connector, stop)
+
+    async def method(self, name: str, *args: Tuple[str, ...]) -> None:
+        """
+        Queue cortile method with arguments, the result is available after dispatch.
+
+        :param name: Name of the cortile method
+        :param args: Arguments of the cortile method
+        """
+        super().method(name, *args)
+
+    async def dispatch(self) -> List[bool | None]:
+        """
+        Execute all queued cortile methods.
+
+        :return: List with True if successful, False otherwise and None if skipped
+        """
+        calls, self.calls = self.calls, []
+        self.results = await self.connector.batch(calls, self.stop) if calls else []
+        return self.results
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+
+import os
+import struct
+import socket
+
+from threading import Thread, Lock, Condition
+from typing import Callable, List, Tuple
+
+from cortile.helper.marshal import Marshal
+
+PROPERTIES_IFACE = 'org.freedesktop.DBus.Properties'
+INTROSPECTABLE_IFACE = 'org.freedesktop.DBus.Introspectable'
+
+Boolean = bool
+
+
+class DBusException(Exception):
+    def __init__(self, message: str = '', name: str = 'org.freedesktop.DBus.Error.Failed'):
+        """
+        Initialize the dbus exception.
+        This helper class carries the dbus error name of failed calls, like the exception of dbus-python.
+
+        :param message: Error message
+        :param name: Dbus error name, default is org.freedesktop.DBus.Error.Failed
+        """
+        super().__init__(f'{name}: {message}')
+        self.name = name
+
+    def get_dbus_name(self) -> str:
+        """
+        Get the dbus error name.
+
+        :return: Dbus error name
+        """
+        return self.name
+
+
+class Bus(object):
+
+    LOCK = Lock()
+    SESSION = None
+    TIMEOUT = 25.0
+    CHUNK = 65536
+
+    def __init__(self, address: str | None = None):
+        """
+        Initialize the dbus connection.
+        This base class keeps one socket to the session bus open and sends method calls
+        from any thread without waiting for earlier replies, which are matched by their serial.
+
+        :param address: Dbus address, default is None for DBUS_SESSION_BUS_ADDRESS
+        """
+        runtime = os.environ.get('XDG_RUNTIME_DIR', f'/run/user/{os.getuid()}')
+        self.address = address or os.environ.get('DBUS_SESSION_BUS_ADDRESS') or f'unix:path={runtime}/bus'
+        self.socket = None
+        self.name = None
+        self.serial = 0
+        self.lock = Lock()
+        self.condition = Condition()
+        self.pending = set()
+        self.replies = {}
+        self.running = False
+
+    @staticmethod
+    def session() -> 'Bus':
+        """
+        Get the process wide session bus connection, which is connected again once it is closed.
+
+        :return: Connected session bus
+        """
+        with Bus.LOCK:
+            if Bus.SESSION is None or not Bus.SESSION.running:
+                Bus.SESSION = Bus()
+                Bus.SESSION.connect()
+            return Bus.SESSION
+
+    def connect(self) -> None:
+        """
+        Open the socket, authenticate with the uid of the process and register on the bus.
+        """
+        error = None
+        for path in self.paths():
+            try:
+                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.socket.connect(path)
+                break
+            except OSError as e:
+                self.socket.close()
+                self.socket, error = None, e
+        if self.socket is None:
+            raise DBusException(f'Failed to connect to {self.address} ({error!r})', 'org.freedesktop.DBus.Error.NoServer')
+        self.socket.sendall(b'\0AUTH EXTERNAL ' + str(os.getuid()).encode().hex().encode() + b'\r\n')
+        line = b''
+        while not line.endswith(b'\r\n'):
+            chunk = self.socket.recv(512)
+            if not chunk:
+                break
+            line += chunk
+        if not line.startswith(b'OK'):
+            self.socket.close()
+            raise DBusException(f'Authentication failed ({line.strip()!r})', 'org.freedesktop.DBus.Error.AuthFailed')
+        self.socket.sendall(b'BEGIN\r\n')
+        self.running = True
+        Thread(target=self.receive, daemon=True).start()
+        try:
+            self.name = self.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'Hello')[0]
+        except DBusException:
+            self.close()
+            raise
+
+    def paths(self) -> List[str]:
+        """
+        Internal function to get the socket paths of all unix addresses.
+
+        :return: List of socket paths, abstract sockets start with a null byte
+        """
+        from urllib.parse import unquote
+        paths = []
+        for address in self.address.split(';'):
+            transport, _, params = address.partition(':')
+            if transport != 'unix':
+                continue
+            params = dict(param.partition('=')[::2] for param in params.split(','))
+            if 'path' in params:
+                paths.append(unquote(params['path']))
+            elif 'abstract' in params:
+                paths.append('\0' + unquote(params['abstract']))
+        return paths
+
+    def get_object(self, name: str, path: str) -> 'Proxy':
+        """
+        Get a proxy for a remote object, like the bus of dbus-python.
+
+        :param name: Dbus name of the remote service
+        :param path: Dbus path of the remote object
+
+        :return: Proxy of the remote object
+        """
+        return Proxy(self, name, path)
+
+    def call(self, destination: str, path: str, interface: str | None, member: str, signature: str = '', args: Tuple[object, ...] = (), timeout: float | None = None) -> List[object]:
+        """
+        Call a remote method and wait for its reply.
+        Arguments are marshalled before anything is sent, so TypeError and ValueError mean the call was not sent.
+
+        :param destination: Dbus name of the remote service
+        :param path: Dbus path of the remote object
+        :param interface: Dbus interface of the method
+        :param member: Name of the method
+        :param signature: Dbus type signature of the arguments, default is empty
+        :param args: Arguments of the method, default is empty
+        :param timeout: Maximum time in seconds to wait for the reply, default is None for 25 seconds
+
+        :return: List of return values
+        """
+        fields = [(1, 'o', path), (3, 's', member), (6, 's', destination)]
+        if interface:
+            fields.append((2, 's', interface))
+        serial = self.send(1, fields, signature, args)
+        with self.condition:
+            self.condition.wait_for(lambda: serial in self.replies or not self.running, timeout or self.TIMEOUT)
+            self.pending.discard(serial)
+            reply = self.replies.pop(serial, None)
+        if reply is None:
+            raise DBusException(f'No reply to {member}', 'org.freedesktop.DBus.Error.NoReply')
+        typ, fields, values = reply
+        if typ == 3:
+            raise DBusException(values[0] if values and isinstance(values[0], str) else '', fields.get(4, 'org.freedesktop.DBus.Error.Failed'))
+        return values
+
+    def send(self, typ: int, fields: List[Tuple[int, str, object]], signature: str = '', args: Tuple[object, ...] = ()) -> int:
+        """
+        Send a message without waiting, replies to method calls are collected by the receive thread.
+
+        :param typ: Message type, 1 for method calls, 2 for replies, 3 for errors and 4 for signals
+        :param fields: Header fields, each with field code, dbus type and value
+        :param signature: Dbus type signature of the body, default is empty
+        :param args: Values of the body, default is empty
+
+        :return: Serial of the sent message
+        """
+        body = Marshal.pack(signature, list(args))
+        if signature:
+            fields = [*fields, (8, 'g', signature)]
+        with self.condition:
+            if not self.running:
+                raise DBusException('Connection is closed', 'org.freedesktop.DBus.Error.Disconnected')
+            self.serial = self.serial % 0xffffffff + 1
+            serial = self.serial
+            if typ == 1:
+                self.pending.add(serial)
+        try:
+            with self.lock:
+                self.socket.sendall(self.encode(typ, serial, fields, body))
+        except OSError as e:
+            with self.condition:
+                self.pending.discard(serial)
+            self.close()
+            raise DBusException(repr(e), 'org.freedesktop.DBus.Error.Disconnected')
+        return serial
+
+    def receive(self) -> None:
+        """
+        Internal function to read messages until the socket is closed and pass them to dispatch.
+        """
+        data = bytearray()
+        while True:
+            try:
+                chunk = self.socket.recv(self.CHUNK)
+            except OSError:
+                chunk = b''
+            if not chunk:
+                break
+            data += chunk
+            while len(data) >= 16:
+                size = Bus.size(data)
+                if len(data) < size:
+                    break
+                message = bytes(data[:size])
+                del data[:size]
+                try:
+                    self.dispatch(*Bus.decode(message))
+                except (ValueError, IndexError, struct.error):
+                    continue
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def dispatch(self, typ: int, serial: int, fields: dict[int, object], values: List[object]) -> None:
+        """
+        Internal function to hand replies and errors to the waiting calls, other messages are ignored.
+
+        :param typ: Message type, 1 for method calls, 2 for replies, 3 for errors and 4 for signals
+        :param serial: Serial of the message
+        :param fields: Header fields by field code
+        :param values: Body values
+        """
+        if typ not in [2, 3]:
+            return
+        with self.condition:
+            if fields.get(5) in self.pending:
+                self.replies[fields[5]] = (typ, fields, values)
+                self.condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Close the socket, waiting calls fail without a reply.
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.socket is not None:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.socket.close()
+
+    @staticmethod
+    def encode(typ: int, serial: int, fields: List[Tuple[int, str, object]], body: bytes) -> bytes:
+        """
+        Encode a little endian dbus message.
+
+        :param typ: Message type, 1 for method calls, 2 for replies, 3 for errors and 4 for signals
+        :param serial: Serial of the message
+        :param fields: Header fields, each with field code, dbus type and value
+        :param body: Marshalled body of the message
+
+        :return: Encoded message
+        """
+        header = bytearray(struct.pack('<cBBBIII', b'l', typ, 0, 1, len(body), serial, 0))
+        for code, signature, value in fields:
+            Marshal.pad(header, 8)
+            Marshal.pack('yg' + signature, [code, signature, value], header)
+        struct.pack_into('<I', header, 12, len(header) - 16)
+        Marshal.pad(header, 8)
+        return bytes(header + body)
+
+    @staticmethod
+    def decode(message: bytes) -> Tuple[int, int, dict[int, object], List[object]]:
+        """
+        Decode a dbus message.
+
+        :param message: Encoded message
+
+        :return: Message type, serial, header fields by field code and body values
+        """
+        endian = '<' if message[:1] == b'l' else '>'
+        typ, = struct.unpack_from('B', message, 1)
+        serial, = struct.unpack_from(endian + 'I', message, 8)
+        fields, offset = Marshal.unpack('a(yv)', message, 12, endian)
+        fields = dict(fields[0])
+        values, _ = Marshal.unpack(fields.get(8, ''), message, Marshal.align(offset, 8), endian)
+        return typ, serial, fields, values
+
+    @staticmethod
+    def size(data: bytes) -> int:
+        """
+        Get the total size of the message at the start of data.
+
+        :param data: Data with at least the first 16 bytes of a message
+
+        :return: Size of the message in bytes
+        """
+        endian = '<' if data[:1] == b'l' else '>'
+        body, _, length = struct.unpack_from(endian + 'III', data, 4)
+        return Marshal.align(16 + length, 8) + body
+
+
+class Proxy(object):
+    def __init__(self, bus: Bus, name: str, path: str):
+        """
+        Initialize the dbus proxy.
+        This helper class provides the Get and get_dbus_method calls of a dbus-python proxy,
+        where argument types are taken from introspection data or guessed from the values.
+
+        :param bus: Connected dbus connection
+        :param name: Dbus name of the remote service
+        :param path: Dbus path of the remote object
+        """
+        self.bus = bus
+        self.name = name
+        self.path = path
+        self.signatures = None
+
+    def Get(self, interface: str, name: str, dbus_interface: str = PROPERTIES_IFACE) -> object:
+        """
+        Get a property of the remote object.
+
+        :param interface: Dbus interface of the property
+        :param name: Name of the property
+        :param dbus_interface: Dbus interface of the Get method, default is org.freedesktop.DBus.Properties
+
+        :return: Property value
+        """
+        return self.bus.call(self.name, self.path, dbus_interface, 'Get', 'ss', (interface, name))[0]
+
+    def get_dbus_method(self, member: str, dbus_interface: str | None = None) -> Callable[..., object]:
+        """
+        Get a remote method as function.
+
+        :param member: Name of the method
+        :param dbus_interface: Dbus interface of the method, default is None
+
+        :return: Function that calls the method and returns None, one value or a tuple of values
+        """
+        def method(*args: Tuple[object, ...]) -> object:
+            signature = self.signature(dbus_interface, member)
+            if signature is None:
+                signature = ''.join(map(Marshal.guess, args))
+            values = self.bus.call(self.name, self.path, dbus_interface, member, signature, args)
+            if not values:
+                return None
+            return values[0] if len(values) == 1 else tuple(values)
+        return method
+
+    def signature(self, interface: str | None, member: str) -> str | None:
+        """
+        Internal function to get the argument signature of a method, which is introspected on the first call.
+
+        :param interface: Dbus interface of the method
+        :param member: Name of the method
+
+        :return: Dbus type signature or None if the method is not introspectable
+        """
+        if self.signatures is None:
+            self.signatures = self.introspect()
+        return self.signatures.get((interface, member))
+
+    def introspect(self) -> dict[Tuple[str | None, str], str]:
+        """
+        Internal function to read the argument signatures of all methods of the remote object.
+
+        :return: Dictionary with the signature for each interface and method name
+        """
+        import xml.etree.ElementTree as ElementTree
+        signatures = {}
+        try:
+            root = ElementTree.fromstring(self.bus.call(self.name, self.path, INTROSPECTABLE_IFACE, 'Introspect')[0])
+        except (DBusException, ElementTree.ParseError):
+            return signatures
+        for interface in root.iter('interface'):
+            for method in interface.iter('method'):
+                signature = ''.join(arg.get('type', '') for arg in method.iter('arg') if arg.get('direction', 'in') == 'in')
+                signatures[(interface.get('name'), method.get('name'))] = signature
+                signatures.setdefault((None, method.get('name')), signature)
+        return signatures
+
+
+def SessionBus() -> Bus:
+    """
+    Get the process wide session bus connection, like the SessionBus of dbus-python.
+
+    :return: Connected session bus
+    """
+    return Bus.session()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import time
+
+from threading import Lock
+
+from cortile.helper.dict import Dict
+
+
+class Cache(object):
+    def __init__(self, default: float | None = None):
+        """
+        Initialize the property cache.
+        This base class stores cortile properties together with the time they were
+        received, to serve cached reads that are not older than a configured maximum age.
+        Writes that are older than the cached property are ignored, e.g. a slow fetch
+        that completes after a newer listener event.
+
+        :param default: Maximum age in seconds of properties without own maximum age, default is None
+        """
+        self.default = default
+        self.lock = Lock()
+        self.values = Dict()
+        self.times = Dict()
+        self.ages = Dict()
+        self.invalid = set()
+        self.stats = Dict(Hits=0, Misses=0, Stale=0, Refreshes=0)
+
+    def get(self, name: str) -> Dict | None:
+        """
+        Get cached property, if it is not older than its maximum age.
+
+        :param name: Name of the cortile property
+
+        :return: Dictionary with property data or None
+        """
+        with self.lock:
+            if name not in self.values:
+                self.stats.Misses += 1
+                return None
+            if self.stale(name):
+                self.stats.Stale += 1
+                return None
+            self.stats.Hits += 1
+            return self.values[name]
+
+    def set(self, name: str, data: Dict, ts: int | None = None) -> bool:
+        """
+        Set cached property, if it is not older than the cached one.
+
+        :param name: Name of the cortile property
+        :param data: Data of the cortile property
+        :param ts: Unix timestamp in milliseconds of the property, default is now
+
+        :return: True if the property was stored, False if it was older
+        """
+        ts = ts if ts is not None else int(time.time_ns() / 1e6)
+        with self.lock:
+            if ts < self.times.get(name, 0):
+                return False
+            self.values[name] = data
+            self.times[name] = ts
+            self.invalid.discard(name)
+        return True
+
+    def expire(self, name: str, age: float | None) -> None:
+        """
+        Set the maximum age of a cached property.
+
+        :param name: Name of the cortile property
+        :param age: Maximum age in seconds or None to disable expiration
+        """
+        with self.lock:
+            if age is None:
+                self.ages.pop(name, None)
+            else:
+                self.ages[name] = age
+
+    def invalidate(self) -> None:
+        """
+        Mark all cached properties as outdated, which only affects properties with a maximum age.
+        """
+        with self.lock:
+            self.invalid.update(self.times)
+
+    def stale(self, name: str) -> bool:
+        """
+        Check if a cached property is older than its maximum age.
+
+        :param name: Name of the cortile property
+
+        :return: True if the property is stale, False otherwise
+        """
+        age = self.ages.get(name, self.default)
+        if age is None:
+            return False
+        if name in self.invalid:
+            return True
+        return time.time_ns() / 1e6 - self.times.get(name, 0) > age * 1000
+
+    def age(self, name: str) -> float | None:
+        """
+        Get the age of a cached property.
+
+        :param name: Name of the cortile property
+
+        :return: Age in seconds or None if the property is not cached
+        """
+        if name not in self.times:
+            return None
+        return (time.time_ns() / 1e6 - self.times[name]) / 1000
@@ -1,42 +1,86 @@
 #!/usr/bin/env python3
 
-from typing import Callable, Tuple
+from threading import Thread, Event, Lock, current_thread, main_thread
+from typing import TYPE_CHECKING, Callable, List, Tuple, IO
 
 from cortile.helper.dict import Dict
 from cortile.helper.logger import Logger
 from cortile.helper.signal import Signal
+from cortile.helper.buffer import Buffer
+from cortile.helper.decoder import Decoder
+from cortile.helper.sampler import Sampler
 from cortile.base.session import Session
+from cortile.base.process import Process
+from cortile.base.index import Index
+from cortile.base.cache import Cache
+from cortile.base.delta import Delta
+
+if TYPE_CHECKING:
+    from cortile.helper.recorder import Recorder
+    from cortile.base.dispatcher import Dispatcher
 
 
 class Connector(object):
-    def __init__(self, log: int = Logger.LEVELS.WARN):
+
+    CACHED = ['Workplace', 'Workspaces', 'Clients', 'Windows']
+
+    AGE = 1.0
+
+    def __init__(self, log: int = Logger.LEVELS.WARN, events: List[str] | None = None, prefetch: List[str] | None = None, session: Session | None = None):
         """
         Initialize the session connector.
         This base class acts as a middle layer and wraps session methods for
         registration of listener callbacks and caching of received cortile properties.
 
         :param log: Logging level, default is warn
+        :param events: Names of cortile events to listen for, default is None for all events
+        :param prefetch: Names of cortile properties fetched concurrently on connect, default is None
+        :param session: Use an existing session, e.g. a replay session, default is None
+
+        The session is connected on the first request or prefetch and the listener process and signal handlers
+        are started on the first listen() or start() call.
+        Until then, cached properties are fetched again once they are older than AGE seconds.
         """
         self.log = Logger(log)
-        self.signal = Signal()
-        self.session = Session()
-        self.properties = Dict()
-        self.listener = [self.observe]
-        result = self.session.connect()
-        if result.Type == 'Result' and result.Data.Success:
-            self.log.info('Init: Connection established')
-        if result.Type == 'Error':
-            self.log.fatal(f'Error: {result.Data.Message}')
-        self.process = self.session.listen(self.callbacks)
+        self.event = Event()
+        self.signal = None
+        self.session = session or Session(log=self.log)
+        self.cache = Cache(self.AGE)
+        self.index = Index()
+        self.listener = []
+        self.subscribers = Dict()
+        self.samplers = Dict()
+        self.debounces = Dict()
+        self.snapshots = Dict()
+        self.dispatcher = None
+        self.queue = None
+        self.recorder = None
+        self.events = None if events is None else set(events)
+        self.lock = Lock()
+        self.process = Process()
+        self.ready = False
+        self.started = False
+        if prefetch:
+            self.connect()
+            self.fetch(*prefetch)
+
+    @property
+    def properties(self) -> Dict:
+        """
+        Cached properties received from internal listener or property calls.
+
+        :return: Dictionary with cached property data
+        """
+        return self.cache.values
 
     @property
     def connected(self) -> bool:
         """
         Flag that indicates if session.connect() was successful.
 
-        :return: True if cortile binary is running, False otherwise
+        :return: True if cortile binary is running and the listener process is running once started, False otherwise
         """
-        return self.process.running and self.session.connected
+        return self.session.connected and (self.process.running or not self.started)
 
     @property
     def exit(self) -> bool:
@@ -45,24 +89,222 @@ class Connector(object):
 
         :return: True if sig event was triggered, False otherwise
         """
-        return self.signal.exit
+        return self.signal is not None and self.signal.exit
+
+    def connect(self) -> bool:
+        """
+        Connect the session on first use, further calls are ignored once connected.
+        A failed connect exits the process on the main thread, on other threads the
+        error is logged and the next request tries to connect again.
+
+        :return: True if the session is connected, False otherwise
+        """
+        with self.lock:
+            if self.ready:
+                return True
+            result = self.session.connect()
+            self.ready = result.Type == 'Result' and result.Data.Success
+        if self.ready:
+            self.log.info('Init: Connection established')
+            return True
+        if current_thread() is main_thread():
+            self.log.fatal('Error: %s', result.Data.Message)
+        self.log.error('Error: %s', result.Data.Message)
+        return False
+
+    def start(self) -> None:
+        """
+        Start the listener process and signal handlers on first use, further calls are ignored.
+        Signal handlers can only be installed from the main thread.
+        """
+        self.connect()
+        with self.lock:
+            if self.signal is None and current_thread() is main_thread():
+                self.signal = Signal(self.event)
+            if self.started:
+                return
+            self.started = True
+            self.cache.default = None
+            self.process = self.session.listen(self.read, *self.filter(), event=self.event, raw=True)
 
     def close(self) -> None:
         """
         Close the connection gracefully.
         """
-        self.log.info(f'Close connection: {self.session.file}')
+        self.log.info('Close connection: %s', self.session.file)
         self.session.disconnect()
         self.process.terminate()
+        for debounce in self.debounces.values():
+            debounce.stop()
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown()
+        if self.queue is not None:
+            self.queue.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        self.event.set()
+        self.log.flush(1.0)
 
-    def listen(self, callback: Callable[[Dict], None]) -> None:
+    def listen(self, callback: Callable[[Dict], None], *events: Tuple[str, ...], sampler: Sampler | None = None) -> None:
         """
         Listen asynchronously to cortile events.
+        If event names are given, the callback only receives events with these names
+        and if the connector filters events, the names are added to the filter.
+        Synthetic delta events like ClientAdded or LayoutChanged are supported as well,
+        where the property they are derived from is fetched first to compare the next listener update with.
 
         :param callback: Callback function for cortile action events
+        :param events: Names of cortile events, default is all events
+        :param sampler: Sampling policy applied before events are parsed, default is None
+        """
+        if not events:
+            self.log.info('Register listener: %d', len(self.listener))
+            self.listener.append(callback)
+        for name in events:
+            self.log.info('Register listener: %s', name)
+            if sampler is None:
+                self.subscribers.setdefault(name, []).append(callback)
+            else:
+                self.samplers.setdefault(name, []).append((callback, sampler))
+        if events:
+            self.include(list(events))
+        for source in dict.fromkeys(Delta.SOURCES[name] for name in events if name in Delta.SOURCES):
+            if source not in self.snapshots:
+                self.seed(source)
+        self.start()
+
+    def unlisten(self, callback: Callable[[Dict], None]) -> None:
+        """
+        Remove a callback from all listeners and subscribers.
+
+        :param callback: Callback function registered with listen()
+        """
+        self.listener = [c for c in self.listener if c is not callback]
+        for name in list(self.subscribers):
+            self.subscribers[name] = [c for c in self.subscribers[name] if c is not callback]
+        for name in list(self.samplers):
+            self.samplers[name] = [(c, s) for c, s in self.samplers[name] if c is not callback]
+
+    def include(self, events: List[str] | None) -> None:
+        """
+        Add event names to the listener filter and restart the listener if needed.
+        Synthetic delta events are mapped to the property they are derived from.
+
+        :param events: Names of cortile events or None to receive all events
+        """
+        if self.events is None:
+            return
+        if events is None:
+            self.events = None
+            return self.restart()
+        sources = [Delta.SOURCES.get(name, name) for name in events]
+        if self.events.issuperset(sources):
+            return
+        self.events.update(sources)
+        self.restart()
+
+    def restart(self) -> None:
+        """
+        Restart the listener process with the current event filter.
+        """
+        if not self.process.running:
+            return
+        self.log.info('Restart listener: %s', ' '.join(self.filter()))
+        process, self.process = self.process, self.session.listen(self.read, *self.filter(), event=self.event, raw=True)
+        process.event = None
+        process.terminate()
+
+    def filter(self) -> List[str]:
         """
-        self.log.info(f'Register listener: {len(self.listener)}')
-        self.listener.append(callback)
+        Get the event names passed to the listener process.
+
+        :return: Sorted list of event names, empty if all events are received
+        """
+        if self.events is None:
+            return []
+        return sorted(self.events | {'Disconnect'})
+
+    def tracked(self, name: str) -> bool:
+        """
+        Check if updates of a property are received by the listener process.
+
+        :param name: Name of the cortile property
+
+        :return: True if updates are received, False otherwise
+        """
+        return name in self.CACHED and (self.events is None or name in self.events)
+
+    def debounce(self, name: str, delay: float, limit: float | None = None) -> None:
+        """
+        Coalesce bursts of events with the same name into the latest event.
+        The property cache is still updated on every event.
+
+        :param name: Name of the cortile event
+        :param delay: Time in seconds without new events until callbacks are executed
+        :param limit: Maximum time in seconds an event can be delayed, default is None
+        """
+        self.log.info('Debounce: %s %ss', name, delay)
+        if name in self.debounces:
+            return self.debounces[name].configure(delay, limit)
+        from cortile.helper.debounce import Debounce
+        self.debounces[name] = Debounce(self.notify, delay, limit, self.log)
+
+    def pool(self, workers: int = 4, size: int = 1024, policy: str = 'block') -> 'Dispatcher':
+        """
+        Execute callbacks in a thread pool instead of the listener thread.
+        Events of each callback are still processed in order and further calls replace the existing pool.
+
+        :param workers: Number of worker threads, default is 4
+        :param size: Maximum number of queued events, default is 1024
+        :param policy: Overflow policy, block the listener or drop the event, default is block
+
+        :return: Dispatcher instance with queue statistics
+        """
+        self.log.info('Pool: %d workers', workers)
+        from cortile.base.dispatcher import Dispatcher
+        previous, self.dispatcher = self.dispatcher, Dispatcher(workers, size, policy, log=self.log)
+        if previous is not None:
+            previous.shutdown()
+        return self.dispatcher
+
+    def buffer(self, size: int = 256, policy: str = 'block') -> Buffer:
+        """
+        Buffer raw events between the listener process and event processing.
+        Events are processed on a separate thread, while the listener keeps reading.
+        Disconnect events are never dropped and further calls change the existing buffer.
+
+        :param size: Maximum number of buffered events, default is 256
+        :param policy: Overflow policy, one of block, drop-oldest, drop-newest or coalesce, default is block
+
+        :return: Buffer instance with queue statistics
+        """
+        self.log.info('Buffer: %d events', size)
+        if self.queue is not None:
+            self.queue.configure(size, policy)
+            return self.queue
+        queue = Buffer(size, policy)
+        Thread(target=self.consume, args=(queue,), daemon=True).start()
+        self.queue = queue
+        return queue
+
+    def record(self, path: str, size: int = 64 * 1024 * 1024, count: int = 5) -> 'Recorder':
+        """
+        Record raw events of the listener process to a compressed json lines file.
+        Lines are written as received, before buffering, sampling and parsing.
+
+        :param path: Path of the recording file, e.g. events.jsonl.gz
+        :param size: Maximum uncompressed bytes per file before rotation, default is 64 MiB
+        :param count: Number of rotated files that are kept, default is 5
+
+        :return: Recorder instance with recording statistics
+        """
+        self.log.info('Record: %s', path)
+        if self.recorder is not None:
+            self.recorder.close()
+        from cortile.helper.recorder import Recorder
+        self.recorder = Recorder(path, size, count)
+        self.start()
+        return self.recorder
 
     def method(self, name: str, *args: Tuple[str, ...]) -> bool:
         """
@@ -73,29 +315,95 @@ class Connector(object):
 
         :return: True if successful, False otherwise
         """
-        self.log.info(f'Method: {name} {" ".join(map(str, args))}')
+        if self.log.enabled('INFO'):
+            self.log.info('Method: %s %s', name, ' '.join(map(str, args)))
+        self.connect()
+        if not self.started:
+            self.cache.invalidate()
         result = self.session.method(name, *args)
         if result.Type == 'Error':
-            self.log.error(f'Error: {result.Data.Message}')
+            self.log.error('Error: %s', result.Data.Message)
         return result.Type == 'Result' and result.Data.Success
 
+    def batch(self, calls: List[List[object]], stop: bool = False) -> List[bool | None]:
+        """
+        Execute multiple cortile methods back to back, each call is sent on its own.
+
+        :param calls: List of method calls, each with method name and arguments
+        :param stop: Stop on the first failed method, default is False
+
+        :return: List with True if successful, False otherwise and None if skipped
+        """
+        if self.log.enabled('INFO'):
+            self.log.info('Batch: %s', ', '.join(str(call[0]) for call in calls))
+        results = [None] * len(calls)
+        self.connect()
+        if not self.started:
+            self.cache.invalidate()
+        for i, result in enumerate(self.session.batch(calls, stop)[:len(calls)]):
+            if result.Type == 'Error':
+                self.log.error('Error: %s', result.Data.Message)
+            results[i] = result.Type == 'Result' and result.Data.Success
+        return results
+
     def property(self, name: str, cached: bool = True) -> Dict | None:
         """
         Retrieve cortile property.
 
         :param name: Name of the cortile property
-        :param cached: Use the cached value from internal listener, default is True
+        :param cached: Use the cached value if it is updated by the internal listener or
+            not older than the maximum age of the property, default is True
+
+        Without a running listener, cached values are used until they are older than AGE seconds.
 
         :return: Dictionary with success data or None
         """
-        self.log.info(f'Property: {name}')
-        if name not in self.properties or not cached:
-            result = self.session.property(name)
-            if result.Type == 'Error':
-                self.log.error(f'Error: {result.Data.Message}')
-            if result.Type == 'Property':
-                self.properties[name] = result.Data
-        return self.properties[name] if name in self.properties else None
+        self.log.info('Property: %s', name)
+        if cached and (self.tracked(name) or name in self.cache.ages):
+            data = self.cache.get(name)
+            if data is not None:
+                return data
+        self.connect()
+        result = self.session.property(name)
+        if result.Type == 'Error':
+            self.log.error('Error: %s', result.Data.Message)
+        if result.Type == 'Property':
+            self.store(name, result.Data, result.Time)
+        return self.properties.get(name)
+
+    def fetch(self, *names: Tuple[str, ...]) -> List[Dict | None]:
+        """
+        Fetch multiple cortile properties concurrently and update the cache.
+
+        :param names: Names of the cortile properties
+
+        :return: List of dictionaries with success data or None
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(len(names), 1)) as executor:
+            return list(executor.map(lambda name: self.property(name, False), names))
+
+    def expire(self, name: str, age: float | None) -> None:
+        """
+        Set the maximum age of a cached property, older values are fetched again.
+
+        :param name: Name of the cortile property
+        :param age: Maximum age in seconds or None to disable expiration
+        """
+        self.cache.expire(name, age)
+
+    def refresh_async(self, name: str) -> Thread:
+        """
+        Fetch a cortile property in the background and update the cache.
+
+        :param name: Name of the cortile property
+
+        :return: Started background thread
+        """
+        self.cache.stats.Refreshes += 1
+        thread = Thread(target=self.property, args=(name, False), daemon=True)
+        thread.start()
+        return thread
 
     def help(self) -> str:
         """
@@ -103,11 +411,13 @@ class Connector(object):
 
         :return: String with help message output
         """
+        self.connect()
         return self.session.help().Data.Message
 
     def observe(self, result: Dict | None) -> None:
         """
         Internal function to update cached properties or disconnect client.
+        It is only called for disconnect events and cached property names.
 
         :param result: Dictionary with success or error data
         """
@@ -115,18 +425,173 @@ class Connector(object):
             return
         if result.Name == 'Disconnect':
             return self.close()
-        self.log.info(f'{result.Type}: {result.Name} update')
-        self.properties[result.Name] = result.Data
+        self.log.info('%s: %s update', result.Type, result.Name)
+        self.store(result.Name, result.Data, result.Time)
+        if not self.delta(result.Name):
+            self.snapshots.pop(result.Name, None)
+            return
+        with self.lock:
+            previous = self.snapshots.get(result.Name)
+            if previous is not None and result.Time < previous.Time:
+                return
+            self.snapshots[result.Name] = result
+        if previous is None:
+            return
+        for event in Delta.compare(result, previous.Data):
+            self.dispatch(event)
+
+    def seed(self, name: str) -> None:
+        """
+        Internal function to fetch the first snapshot of a property that synthetic delta events are compared with.
+        Snapshots are only advanced by listener events, so fetched or refreshed properties don't hide changes.
+
+        :param name: Name of the cortile property
+        """
+        self.connect()
+        result = self.session.property(name)
+        if result.Type == 'Error':
+            return self.log.error('Error: %s', result.Data.Message)
+        self.store(name, result.Data, result.Time)
+        with self.lock:
+            self.snapshots.setdefault(name, result)
+
+    def delta(self, name: str) -> bool:
+        """
+        Internal function to check if synthetic delta events of a property are subscribed.
+
+        :param name: Name of the cortile property
+
+        :return: True if delta events are subscribed, False otherwise
+        """
+        return any(source == name and self.subscribers.get(event) for event, source in Delta.SOURCES.items())
+
+    def store(self, name: str, data: Dict, ts: int | None = None) -> bool:
+        """
+        Internal function to update a cached property and its index.
+
+        :param name: Name of the cortile property
+        :param data: Data of the cortile property
+        :param ts: Unix timestamp in milliseconds of the property, default is now
+
+        :return: True if the property was stored, False if it was older than the cached one
+        """
+        if not self.cache.set(name, data, ts):
+            return False
+        self.index.update(name, data)
+        return True
 
-    def callbacks(self, result: Dict | None) -> None:
+    def read(self, stdout: IO, stderr: IO, code: int) -> None:
+        """
+        Internal function to pass raw events from the listener process to the buffer, if any.
+
+        :param stdout: Success output of listener process
+        :param stderr: Error output of listener process
+        :param code: Status code of listener process
+        """
+        recorder = self.recorder
+        if recorder is not None and stdout:
+            recorder.write(stdout)
+        queue = self.queue
+        if queue is None:
+            return self.receive(stdout, stderr, code)
+        name = Sampler.peek(stdout) if queue.policy != 'block' else None
+        queue.push((stdout, stderr, code), name if queue.policy == 'coalesce' else None, name == 'Disconnect')
+
+    def consume(self, queue: Buffer) -> None:
+        """
+        Internal function to process raw events from the buffer until it is closed.
+
+        :param queue: Buffer with raw events
+        """
+        while True:
+            item = queue.pop()
+            if item is None:
+                return
+            self.receive(*item)
+
+    def receive(self, stdout: IO, stderr: IO, code: int) -> None:
+        """
+        Internal function to apply sampling policies on raw events before they are parsed.
+
+        :param stdout: Success output of listener process
+        :param stderr: Error output of listener process
+        :param code: Status code of listener process
+        """
+        name = Sampler.peek(stdout) if self.samplers else None
+        if name not in self.samplers:
+            return self.callbacks(self.session.parse(stdout, stderr, code))
+        data = []
+
+        def load() -> dict:
+            if not data:
+                data.append(Decoder.loads(stdout))
+            return data[0]
+
+        try:
+            sampled = [callback for callback, sampler in self.samplers[name] if sampler.accept(load)]
+            if not sampled and not self.consumed(name):
+                return
+            result = Dict.wrap(load())
+        except ValueError:
+            return self.callbacks(self.session.parse(stdout, stderr, code))
+        self.callbacks(result, sampled)
+
+    def consumed(self, name: str) -> bool:
+        """
+        Internal function to check if events are required without sampling.
+
+        :param name: Name of the cortile event
+
+        :return: True if events are cached or passed to callbacks without sampling, False otherwise
+        """
+        return bool(name == 'Disconnect' or name in self.CACHED or name in self.debounces or self.subscribers.get(name) or self.listener)
+
+    def callbacks(self, result: Dict | None, sampled: List[Callable[[Dict], None]] | None = None) -> None:
         """
         Internal function to execute registered callback functions.
 
         :param result: Dictionary with success or error data
+        :param sampled: Callback functions of sampled subscriptions that accepted the event
         """
         if not result:
             return
+        if result.Name == 'Disconnect' or result.Name in self.CACHED:
+            self.observe(result)
+        for callback in sampled or []:
+            self.execute(callback, result)
+        if result.Name in self.debounces:
+            return self.debounces[result.Name].push(result)
+        self.notify(result)
+
+    def notify(self, result: Dict) -> None:
+        """
+        Internal function to execute subscribed and registered callback functions.
+
+        :param result: Dictionary with success or error data
+        """
+        self.dispatch(result)
         for callback in self.listener:
-            if not callable(callback):
-                continue
-            callback(result)
+            self.execute(callback, result)
+
+    def dispatch(self, result: Dict) -> None:
+        """
+        Internal function to execute callback functions subscribed to an event name.
+
+        :param result: Dictionary with success or error data
+        """
+        for callback in self.subscribers.get(result.Name, []):
+            self.execute(callback, result)
+
+    def execute(self, callback: Callable[[Dict], None], result: Dict) -> None:
+        """
+        Internal function to execute a callback function directly or in the thread pool.
+
+        :param callback: Callback function for cortile events
+        :param result: Dictionary with success or error data
+        """
+        if not callable(callback):
+            return
+        if self.dispatcher is not None:
+            self.dispatcher.submit(callback, result)
+            return
+        callback(result)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+from typing import List
+
+from cortile.helper.dict import Dict
+from cortile.base.index import Index
+
+
+class Delta(object):
+
+    SOURCES = Dict(
+        ClientAdded='Clients',
+        ClientRemoved='Clients',
+        ClientMoved='Clients',
+        LayoutChanged='Workspaces'
+    )
+
+    @staticmethod
+    def compare(result: Dict, previous: Dict) -> List[Dict]:
+        """
+        Compare two successive snapshots of a cortile property.
+        This helper creates synthetic events for clients that were added, removed
+        or moved and for layouts that changed on a desktop and screen.
+
+        :param result: Dictionary with the current property event
+        :param previous: Data of the previous property snapshot
+
+        :return: List of synthetic events
+        """
+        old = Index.build(result.Name, previous.Values)
+        new = Index.build(result.Name, result.Data.Values)
+        if result.Name == 'Clients':
+            return Delta.clients(result, old.Ids, new.Ids)
+        if result.Name == 'Workspaces':
+            return Delta.layouts(result, old.Layouts, new.Layouts)
+        return []
+
+    @staticmethod
+    def clients(result: Dict, old: Dict, new: Dict) -> List[Dict]:
+        """
+        Internal function to compare clients by window id.
+
+        :param result: Dictionary with the current property event
+        :param old: Previous clients by window id
+        :param new: Current clients by window id
+
+        :return: List of synthetic client events
+        """
+        events = []
+        for id, client in new.items():
+            if id not in old:
+                events.append(Delta.event(result, 'ClientAdded', client))
+                continue
+            source, target = old[id].Latest.Location, client.Latest.Location
+            if (source.Desktop, source.Screen) != (target.Desktop, target.Screen):
+                events.append(Delta.event(result, 'ClientMoved', Dict(Client=client, From=source, To=target)))
+        for id, client in old.items():
+            if id not in new:
+                events.append(Delta.event(result, 'ClientRemoved', client))
+        return events
+
+    @staticmethod
+    def layouts(result: Dict, old: Dict, new: Dict) -> List[Dict]:
+        """
+        Internal function to compare active layouts by desktop and screen.
+
+        :param result: Dictionary with the current property event
+        :param old: Previous active layouts by location
+        :param new: Current active layouts by location
+
+        :return: List of synthetic layout events
+        """
+        events = []
+        for location in dict.fromkeys([*old.keys(), *new.keys()]):
+            source, target = old.get(location), new.get(location)
+            if (source and source.Name) == (target and target.Name):
+                continue
+            data = Dict(Location=Dict(Desktop=location[0], Screen=location[1]), Layout=target, Previous=source)
+            events.append(Delta.event(result, 'LayoutChanged', data))
+        return events
+
+    @staticmethod
+    def event(result: Dict, name: str, data: Dict) -> Dict:
+        """
+        Internal function to create a synthetic event.
+
+        :param result: Dictionary with the current property event
+        :param name: Name of the synthetic event
+        :param data: Data of the synthetic event
+
+        :return: Dictionary with synthetic event data
+        """
+        return Dict(
+            Process=result.Process,
+            Time=result.Time,
+            Type='Delta',
+            Name=name,
+            Data=data
+        )
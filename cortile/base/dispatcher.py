@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+import traceback
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition
+from typing import Callable
+
+from cortile.helper.dict import Dict
+from cortile.helper.logger import Logger
+
+
+class Dispatcher(object):
+
+    POLICIES = ['block', 'drop']
+
+    def __init__(self, workers: int = 4, size: int = 1024, policy: str = 'block', burst: int = 32, log: Logger | None = None):
+        """
+        Initialize the callback dispatcher.
+        This base class executes listener callbacks in a thread pool, where events of
+        each callback are processed in order and the number of queued events is bounded.
+
+        :param workers: Number of worker threads, default is 4
+        :param size: Maximum number of queued events, default is 1024
+        :param policy: Overflow policy, block the caller or drop the event, default is block
+        :param burst: Maximum number of events processed before a callback yields its worker, default is 32
+        :param log: Logger for errors raised by callbacks, default is None
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unknown policy {policy}')
+        self.size = size
+        self.policy = policy
+        self.burst = burst
+        self.log = log
+        self.queues = Dict()
+        self.active = set()
+        self.condition = Condition()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cortile')
+        self.stats = Dict(Depth=0, Peak=0, Submitted=0, Executed=0, Dropped=0, Errors=0)
+
+    def submit(self, callback: Callable[[Dict], None], result: Dict) -> bool:
+        """
+        Queue an event for a callback function.
+
+        :param callback: Callback function for cortile events
+        :param result: Dictionary with event data
+
+        :return: True if the event was queued, False if it was dropped
+        """
+        with self.condition:
+            if self.stats.Depth >= self.size and self.policy == 'drop':
+                self.stats.Dropped += 1
+                return False
+            while self.stats.Depth >= self.size:
+                self.condition.wait()
+            self.queues.setdefault(callback, deque()).append(result)
+            self.stats.Depth += 1
+            self.stats.Submitted += 1
+            self.stats.Peak = max(self.stats.Peak, self.stats.Depth)
+            if callback in self.active:
+                return True
+            self.active.add(callback)
+        self.schedule(callback)
+        return True
+
+    def drain(self, callback: Callable[[Dict], None]) -> None:
+        """
+        Internal function to process queued events of a callback function in order.
+
+        :param callback: Callback function for cortile events
+        """
+        for _ in range(self.burst):
+            with self.condition:
+                queue = self.queues.get(callback)
+                if not queue:
+                    self.active.discard(callback)
+                    return
+                result = queue.popleft()
+                self.stats.Depth -= 1
+                self.condition.notify_all()
+            error = False
+            try:
+                callback(result)
+            except Exception:
+                error = True
+                if self.log is not None:
+                    self.log.error('Dispatcher: %s', traceback.format_exc().rstrip())
+            with self.condition:
+                self.stats.Executed += 1
+                self.stats.Errors += error
+        self.schedule(callback)
+
+    def schedule(self, callback: Callable[[Dict], None]) -> None:
+        """
+        Internal function to run the queued events of a callback function on a worker thread.
+
+        :param callback: Callback function for cortile events
+        """
+        try:
+            self.executor.submit(self.drain, callback)
+        except RuntimeError:
+            self.active.discard(callback)
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads without waiting for queued events.
+        """
+        with self.condition:
+            self.queues.clear()
+            self.active.clear()
+            self.stats.Depth = 0
+            self.condition.notify_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
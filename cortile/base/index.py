@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+from threading import Lock
+from typing import List
+
+from cortile.helper.dict import Dict
+
+
+class Index(object):
+    def __init__(self):
+        """
+        Initialize the property index.
+        This base class maintains lookup tables derived from cached cortile properties,
+        which are rebuilt once on the first lookup after a property update was received.
+        """
+        self.lock = Lock()
+        self.sources = Dict()
+        self.tables = Dict()
+
+    def update(self, name: str, data: Dict) -> None:
+        """
+        Update the source of the lookup tables.
+
+        :param name: Name of the cortile property
+        :param data: Data of the cortile property
+        """
+        if name not in ['Clients', 'Workspaces']:
+            return
+        with self.lock:
+            self.sources[name] = data
+            self.tables.pop(name, None)
+
+    def client(self, id: int) -> Dict | None:
+        """
+        Get client by window id.
+
+        :param id: Id of the client window
+
+        :return: Tracked client or None
+        """
+        return self.table('Clients').Ids.get(id)
+
+    def clients(self, desktop: int, screen: int) -> List[Dict]:
+        """
+        Get clients by location.
+
+        :param desktop: Index of the desktop
+        :param screen: Index of the screen
+
+        :return: List of tracked clients on the desktop and screen
+        """
+        return self.table('Clients').Locations.get((desktop, screen), [])
+
+    def classes(self, name: str) -> List[Dict]:
+        """
+        Get clients by window class name.
+
+        :param name: Case insensitive window class name
+
+        :return: List of tracked clients with the window class name
+        """
+        return self.table('Clients').Classes.get(name.lower(), [])
+
+    def layout(self, desktop: int, screen: int) -> Dict | None:
+        """
+        Get active layout by location.
+
+        :param desktop: Index of the desktop
+        :param screen: Index of the screen
+
+        :return: Active layout with tiling enabled or None
+        """
+        return self.table('Workspaces').Layouts.get((desktop, screen))
+
+    def layouts(self) -> List[Dict]:
+        """
+        Get all active layouts.
+
+        :return: List of active layouts with tiling enabled
+        """
+        return list(self.table('Workspaces').Layouts.values())
+
+    def table(self, name: str) -> Dict:
+        """
+        Internal function to get or rebuild the lookup table of a property.
+
+        :param name: Name of the cortile property
+
+        :return: Dictionary with lookup tables
+        """
+        table = self.tables.get(name)
+        if table is not None:
+            return table
+        with self.lock:
+            source = self.sources.get(name)
+            table = self.build(name, source.Values if source else [])
+            if self.sources.get(name) is source:
+                self.tables[name] = table
+        return table
+
+    @staticmethod
+    def build(name: str, values: List[Dict]) -> Dict:
+        """
+        Internal function to build the lookup tables of a property.
+
+        :param name: Name of the cortile property
+        :param values: Values of the cortile property
+
+        :return: Dictionary with lookup tables
+        """
+        if name == 'Workspaces':
+            layouts = Dict()
+            for workspace in values:
+                if not workspace.Tiling:
+                    continue
+                layout = workspace.Layouts[workspace.Layout]
+                layouts[(layout.Location.Desktop, layout.Location.Screen)] = layout
+            return Dict(Layouts=layouts)
+        ids, locations, classes = Dict(), Dict(), Dict()
+        for client in values:
+            location = client.Latest.Location
+            ids[client.Window.Id] = client
+            locations.setdefault((location.Desktop, location.Screen), []).append(client)
+            classes.setdefault(client.Latest.Class.lower(), []).append(client)
+        return Dict(Ids=ids, Locations=locations, Classes=classes)
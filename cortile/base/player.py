@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+from threading import Event, current_thread
+from typing import Callable, Tuple, IO
+
+from cortile.helper.sampler import Sampler
+from cortile.base.process import Process
+
+
+class Player(Process):
+    def __init__(self, source: object, *args: Tuple[str, ...], event: Event | None = None):
+        """
+        Initialize the player thread.
+        This base class stands in for the listener process of replay and simulator sessions and
+        sends their event lines to the callback, where the event names in args act as filter.
+
+        :param source: Replay or simulator session that provides the event lines
+        :param args: Names of cortile events, default is all events
+        :param event: Optional event that is set when the player thread exits
+        """
+        super().__init__(event=event)
+        self.source = source
+        self.names = set(args)
+        self.halt = Event()
+
+    def run(self) -> None:
+        """
+        Send each event line to callback, until the session ends or the player is terminated.
+        """
+        while callable(self.callback) and not self.halt.is_set():
+            line = self.source.next()
+            if line is None:
+                break
+            delay = self.source.delay(line)
+            if delay > 0 and self.halt.wait(delay):
+                self.source.rewind(line)
+                break
+            name = Sampler.peek(line)
+            self.source.update(name, line)
+            if self.names and name not in self.names:
+                continue
+            self.stats.Lines += 1
+            self.stats.Bytes += len(line)
+            try:
+                self.callback(line, b'', 0)
+            except Exception as e:
+                break
+        self.open.clear()
+        if self.event is not None and not self.halt.is_set():
+            self.event.set()
+
+    def communicate(self, callback: Callable[[IO, IO, int], None] | None = None) -> None:
+        """
+        Start sending event lines to callback.
+
+        :param callback: Callback function for raw event lines
+        """
+        if not callable(callback):
+            return
+        self.callback = callback
+        self.open.set()
+        self.start()
+
+    def terminate(self) -> None:
+        """
+        Terminate the player thread gracefully, the event is not set for terminated players.
+        """
+        self.halt.set()
+        if self.is_alive() and current_thread() is not self:
+            self.join()
@@ -1,25 +1,34 @@
 #!/usr/bin/env python3
 
-import subprocess
+import os
 
 from threading import Thread, Event
 from typing import Callable, Tuple, IO
 
+from cortile.helper.dict import Dict
+
 
 class Process(Thread):
-    def __init__(self, *args: Tuple[str, ...]):
+
+    CHUNK = 65536
+
+    def __init__(self, *args: Tuple[str, ...], event: Event | None = None):
         """
         Initialize the process thread.
         This base class runs a subprocess in a background thread and returns
         stdout and stderr, either synchronously or asynchronously using callbacks.
 
         :param args: Process binary path and arguments
+        :param event: Optional event that is set when the subprocess thread exits
         """
         super().__init__(daemon=True)
         self.process = None
         self.callback = None
+        self.event = event
         self.open = Event()
+        self.stats = Dict(Reads=0, Bytes=0, Lines=0)
         if len(args):
+            import subprocess
             self.process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             self.open.set()
 
@@ -34,19 +43,41 @@ class Process(Thread):
 
     def run(self) -> None:
         """
-        Run the subprocess and send stdout to callback.
+        Run the subprocess and send each stdout line to callback.
+        The pipe is read in chunks with blocking reads, until end of file.
         """
-        if not isinstance(self.process, subprocess.Popen):
+        if self.process is None:
             return
-        while callable(self.callback) and self.process.poll() is None:
+        fd = self.process.stdout.fileno()
+        parts = []
+        while callable(self.callback):
+            try:
+                chunk = os.read(fd, self.CHUNK)
+            except Exception as e:
+                break
+            self.stats.Reads += 1
+            if not chunk:
+                break
+            self.stats.Bytes += len(chunk)
+            parts.append(chunk)
+            if b'\n' not in chunk:
+                continue
+            *lines, rest = b''.join(parts).split(b'\n')
+            parts = [rest] if rest else []
             try:
-                stdout = self.process.stdout.readline()
-                if stdout is None or len(stdout) == 0:
-                    continue
-                self.callback(stdout, b'', 0)
+                for line in lines:
+                    if not line:
+                        continue
+                    self.stats.Lines += 1
+                    self.callback(line, b'', 0)
             except Exception as e:
                 break
+        if parts and callable(self.callback):
+            self.stats.Lines += 1
+            self.callback(b''.join(parts), b'', 0)
         self.open.clear()
+        if self.event is not None:
+            self.event.set()
 
     def communicate(self, callback: Callable[[IO, IO, int], None] | None = None) -> Tuple[IO, IO, int] | None:
         """
@@ -54,7 +85,7 @@ class Process(Thread):
 
         :param callback: Optional callback function for asynchronous calls
         """
-        if not isinstance(self.process, subprocess.Popen):
+        if self.process is None:
             return
         if not callable(callback):
             return *self.process.communicate(), self.process.poll()
@@ -65,6 +96,6 @@ class Process(Thread):
         """
         Terminate the subprocess thread gracefully.
         """
-        if not isinstance(self.process, subprocess.Popen):
+        if self.process is None:
             return
         self.process.terminate()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+import re
+import gzip
+import time
+
+from threading import Event, Lock
+from typing import Callable, Iterator, Tuple
+
+from cortile.helper.dict import Dict
+from cortile.helper.sampler import Sampler
+from cortile.base.session import Session
+from cortile.base.player import Player
+
+
+class Replay(Session):
+
+    TYPE = re.compile(rb'"Type"\s*:\s*"(\w+)"')
+    TIME = re.compile(rb'"Time"\s*:\s*(\d+)')
+
+    PROPERTIES = ['Workplace', 'Workspaces', 'Clients', 'Windows']
+
+    def __init__(self, *paths: Tuple[str, ...], speed: float | None = 1.0):
+        """
+        Initialize the replay session.
+        This base class stands in for a session and replays events recorded with Cortile.record(),
+        where properties are answered from the latest replayed events and method calls are
+        captured instead of executed, so no running cortile instance is required.
+
+        :param paths: Paths of the recording files, oldest first, e.g. events.1.jsonl.gz and events.jsonl.gz
+        :param speed: Factor applied to the recorded timing, None to replay as fast as possible, default is 1.0
+        """
+        super().__init__(native=False)
+        self.paths = paths
+        self.speed = speed
+        self.lock = Lock()
+        self.lines = None
+        self.pending = []
+        self.player = None
+        self.origin = None
+        self.clock = None
+        self.properties = Dict()
+        self.calls = []
+
+    @property
+    def connected(self) -> bool:
+        """
+        Flag that indicates if connect() was successful.
+
+        :return: True if the recording is open, False otherwise
+        """
+        return self.lines is not None
+
+    def connect(self) -> Dict:
+        """
+        Open the recording and look up the first recorded value of each property.
+
+        :return: Dictionary with success or error data
+        """
+        try:
+            for line in self.read():
+                if not self.recorded(line):
+                    continue
+                self.properties.setdefault(Sampler.peek(line), line)
+                if all(name in self.properties for name in self.PROPERTIES):
+                    break
+        except Exception as e:
+            return self.data('Error', Message=repr(e))
+        self.lines = self.read()
+        self.file = self.paths[0] if self.paths else str()
+        return self.data('Result', Success=True)
+
+    def disconnect(self) -> None:
+        """
+        Close the recording.
+        """
+        self.lines = None
+        self.file = str()
+
+    def read(self) -> Iterator[bytes]:
+        """
+        Read the recorded event lines of all files, compressed files must end with .gz.
+
+        :return: Iterator over raw event lines
+        """
+        for path in self.paths:
+            with (gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')) as file:
+                for line in file:
+                    line = line.rstrip(b'\n')
+                    if line:
+                        yield line
+
+    def next(self) -> bytes | None:
+        """
+        Get the next recorded event line.
+
+        :return: Raw event line or None if the recording ended
+        """
+        with self.lock:
+            if self.pending:
+                return self.pending.pop()
+            if self.lines is None:
+                return None
+            return next(self.lines, None)
+
+    def rewind(self, line: bytes) -> None:
+        """
+        Put back an event line that was not replayed.
+
+        :param line: Raw event line
+        """
+        with self.lock:
+            self.pending.append(line)
+
+    def delay(self, line: bytes) -> float:
+        """
+        Get the time until an event line is due, relative to the first replayed event.
+
+        :param line: Raw event line
+
+        :return: Time in seconds, zero or negative if the event is due
+        """
+        match = Replay.TIME.search(line)
+        if not self.speed or match is None:
+            return 0.0
+        with self.lock:
+            if self.origin is None:
+                self.origin = int(match.group(1))
+                self.clock = time.monotonic()
+            return self.clock + (int(match.group(1)) - self.origin) / 1000 / self.speed - time.monotonic()
+
+    def update(self, name: str | None, line: bytes) -> None:
+        """
+        Store a replayed event line as latest value of a property.
+
+        :param name: Name of the cortile event
+        :param line: Raw event line
+        """
+        if name is None or not self.recorded(line):
+            return
+        with self.lock:
+            self.properties[name] = line
+
+    @staticmethod
+    def recorded(line: bytes) -> bool:
+        """
+        Check if an event line contains a property value.
+
+        :param line: Raw event line
+
+        :return: True if the event type is property, False otherwise
+        """
+        match = Replay.TYPE.search(line)
+        return match is not None and match.group(1) == b'Property'
+
+    def listen(self, callback: Callable[[Dict], None], *args: Tuple[str, ...], event: Event | None = None, raw: bool = False) -> Player:
+        """
+        Replay recorded events asynchronously, a restarted listener continues where the previous one stopped.
+
+        :param callback: Callback function for cortile action events
+        :param args: Names of cortile events, default is all events
+        :param event: Optional event that is set when the replay ends
+        :param raw: Pass raw event lines instead of parsed dictionaries, default is False
+
+        :return: Player instance that replays the events
+        """
+        player = Player(self, *map(str, args), event=event)
+        if not self.connected:
+            if raw and callable(callback):
+                callback(b'', b'Not connected', 0)
+            elif callable(callback):
+                callback(self.data('Error', Message='Not connected'))
+            if event is not None:
+                event.set()
+            return player
+        if self.player is not None:
+            self.player.terminate()
+        self.player = player
+        player.communicate(callback if raw else lambda a, b, c: callback(self.parse(a, b, c)))
+        return player
+
+    def method(self, name: str, *args: Tuple[str, ...]) -> Dict:
+        """
+        Capture cortile method with arguments instead of executing it.
+
+        :param name: Name of the cortile method
+        :param args: Arguments of the cortile method
+
+        :return: Dictionary with success or error data
+        """
+        if not self.connected:
+            return self.data('Error', Message='Not connected')
+        with self.lock:
+            self.calls.append([name, *args])
+        return self.format('Result', name, Dict(Success=True))
+
+    def property(self, name: str) -> Dict:
+        """
+        Retrieve the latest replayed value of a cortile property.
+
+        :param name: Name of the cortile property
+
+        :return: Dictionary with success or error data
+        """
+        if not self.connected:
+            return self.data('Error', Message='Not connected')
+        with self.lock:
+            line = self.properties.get(name)
+        if line is None:
+            return self.data('Error', Message=f'Property {name} not recorded')
+        return self.parse(line, b'', 0)
+
+    def help(self) -> Dict:
+        """
+        Show the replayed recording files.
+
+        :return: Dictionary with success or error data
+        """
+        return self.data('Result', Message=f'Replay of {", ".join(self.paths)}')
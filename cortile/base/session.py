@@ -2,16 +2,28 @@
 
 import os
 import time
-import dbus
 
-from typing import Callable, Tuple, IO
+from threading import Event
+from typing import Callable, List, Tuple, IO
 
 from cortile.helper.dict import Dict
+from cortile.helper.decoder import Decoder
+from cortile.helper.logger import Logger
 from cortile.base.process import Process
 
 
 class Session(object):
-    def __init__(self, name: str = 'com.github.leukipp.cortile', path: str = '/com/github/leukipp/cortile'):
+
+    UNSENT = [
+        'org.freedesktop.DBus.Error.Disconnected',
+        'org.freedesktop.DBus.Error.NameHasNoOwner',
+        'org.freedesktop.DBus.Error.ServiceUnknown',
+        'org.freedesktop.DBus.Error.UnknownObject',
+        'org.freedesktop.DBus.Error.UnknownInterface',
+        'org.freedesktop.DBus.Error.UnknownMethod'
+    ]
+
+    def __init__(self, name: str = 'com.github.leukipp.cortile', path: str = '/com/github/leukipp/cortile', native: bool = True, log: Logger | None = None):
         """
         Initialize the dbus connector.
         This base class connects to the running cortile instance and communicates
@@ -19,9 +31,18 @@ class Session(object):
 
         :param name: Dbus name, default is com.github.leukipp.cortile
         :param path: Dbus path, default is /com/github/leukipp/cortile
+        :param native: Use the dbus proxy for methods and properties, default is True
+        :param log: Logger for failed dbus proxy calls, default is None
+
+        Proxy calls fall back to the cortile dbus client only if they could not be dispatched,
+        calls that timed out or failed afterwards are not executed twice.
         """
         self.name = name
         self.path = path
+        self.native = native
+        self.log = log
+        self.dbus = None
+        self.proxy = None
         self.file = str()
 
     @property
@@ -36,36 +57,60 @@ class Session(object):
     def connect(self) -> Dict:
         """
         Retrieve cortile binary path with a direct dbus call.
+        The dbus module is imported on the first connect, to keep the package import fast.
 
         :return: Dictionary with success or error data
         """
         try:
-            self.file = str(dbus.SessionBus().get_object(self.name, self.path).Get(self.name, 'Process')['Path'])
+            self.proxy = self.bus().get_object(self.name, self.path)
+            self.file = str(self.proxy.Get(self.name, 'Process')['Path'])
         except Exception as e:
+            self.proxy = None
             return self.data('Error', Message=repr(e))
         return self.data('Result', Success=True)
 
+    def bus(self) -> object:
+        """
+        Internal function to get the session bus, from dbus-python if it is installed.
+        Otherwise the built-in bus connection is used, which keeps one socket open for all proxy calls as well.
+
+        :return: Session bus of dbus-python or the built-in bus connection
+        """
+        try:
+            import dbus
+        except ImportError:
+            from cortile.base import bus as dbus
+        self.dbus = dbus
+        return dbus.SessionBus()
+
     def disconnect(self) -> None:
         """
-        Disconnect session by resetting cortile binary path.
+        Disconnect session by resetting cortile binary path and dbus proxy.
         """
+        self.proxy = None
         self.file = str()
 
-    def listen(self, callback: Callable[[Dict], None], *args: Tuple[str, ...]) -> Process:
+    def listen(self, callback: Callable[[Dict], None], *args: Tuple[str, ...], event: Event | None = None, raw: bool = False) -> Process:
         """
         Listen asynchronously to cortile events.
 
         :param callback: Callback function for cortile action events
         :param args: Optional arguments to filter cortile event types
+        :param event: Optional event that is set when listening stops
+        :param raw: Pass unparsed stdout, stderr and status code to callback, default is False
 
         :return: Running or empty background process thread
         """
         if not self.connected:
-            if callable(callback):
+            if callable(callback) and raw:
+                callback(b'', b'Not connected', 0)
+            elif callable(callback):
                 callback(self.data('Error', Message='Not connected'))
+            if event is not None:
+                event.set()
             return Process()
-        process = Process(self.file, 'dbus', '-listen', *map(str, args))
-        process.communicate(lambda a, b, c: callback(self.parse(a, b, c)))
+        process = Process(self.file, 'dbus', '-listen', *map(str, args), event=event)
+        process.communicate(callback if raw else lambda a, b, c: callback(self.parse(a, b, c)))
         return process
 
     def method(self, name: str, *args: Tuple[str, ...]) -> Dict:
@@ -79,9 +124,32 @@ class Session(object):
         """
         if not self.connected:
             return self.data('Error', Message='Not connected')
+        if self.native and self.proxy is not None:
+            result = self.call('Result', name, lambda: self.proxy.get_dbus_method(name, self.name)(*args))
+            if result is not None:
+                return result
         process = Process(self.file, 'dbus', '-method', name, *map(str, args))
         return self.parse(*process.communicate())
 
+    def batch(self, calls: List[List[object]], stop: bool = False) -> List[Dict]:
+        """
+        Execute multiple cortile methods back to back, each call is sent on its own.
+
+        :param calls: List of method calls, each with method name and arguments
+        :param stop: Stop on the first failed method, default is False
+
+        :return: List of dictionaries with success or error data, one for each executed method
+        """
+        if not self.connected:
+            return [self.data('Error', Message='Not connected')]
+        results = []
+        for name, *args in calls:
+            result = self.method(name, *args)
+            results.append(result)
+            if stop and not (result.Type == 'Result' and result.Data.Success):
+                break
+        return results
+
     def property(self, name: str) -> Dict:
         """
         Retrieve cortile property.
@@ -92,6 +160,10 @@ class Session(object):
         """
         if not self.connected:
             return self.data('Error', Message='Not connected')
+        if self.native and self.proxy is not None:
+            result = self.call('Property', name, lambda: self.proxy.Get(self.name, name, dbus_interface=self.dbus.PROPERTIES_IFACE))
+            if result is not None:
+                return result
         process = Process(self.file, 'dbus', '-property', name)
         return self.parse(*process.communicate())
 
@@ -106,6 +178,40 @@ class Session(object):
         process = Process(self.file, 'dbus', '-help')
         return self.parse(*process.communicate())
 
+    def call(self, typ: str, name: str, request: Callable[[], object]) -> Dict | None:
+        """
+        Internal function to execute a dbus proxy call.
+
+        :param typ: Type of the data
+        :param name: Name of the cortile method or property
+        :param request: Function that executes the proxy call
+
+        :return: Dictionary with success or error data, None if the call was not dispatched
+        """
+        try:
+            result = request()
+        except (TypeError, ValueError) as e:
+            return self.fallback(name, e)
+        except self.dbus.DBusException as e:
+            if e.get_dbus_name() in self.UNSENT:
+                return self.fallback(name, e)
+            return self.data('Error', Message=repr(e))
+        try:
+            return self.convert(typ, name, result)
+        except Exception as e:
+            return self.data('Error', Message=repr(e))
+
+    def fallback(self, name: str, error: Exception) -> None:
+        """
+        Internal function to log a dbus proxy call that is retried with the cortile dbus client.
+
+        :param name: Name of the cortile method or property
+        :param error: Exception raised before the call was sent
+        """
+        if self.log is not None:
+            self.log.warn('Dbus: %s not sent, using client (%r)', name, error)
+        return None
+
     @staticmethod
     def parse(stdout: IO, stderr: IO, code: int) -> Dict:
         """
@@ -117,12 +223,57 @@ class Session(object):
 
         :return: Dictionary with success or error data
         """
-        out = stdout.decode('utf-8').strip()
+        out = stdout.strip()
+        if out[:1] == b'{' and out[-1:] == b'}':
+            try:
+                return Decoder.decode(out)
+            except ValueError:
+                pass
+        out = out.decode('utf-8', 'replace')
         err = stderr.decode('utf-8').strip()
-        if out.startswith('{') and out.endswith('}'):
-            return Dict.from_json(out)
         return Session.data('Error', Message=f'{out} {err} {"(" + str(code) + ")" if code else ""}'.strip())
 
+    def convert(self, typ: str, name: str, value: object) -> Dict:
+        """
+        Convert return values from dbus proxy calls.
+
+        :param typ: Type of the data
+        :param name: Name of the cortile method or property
+        :param value: Return value of the dbus call
+
+        :return: Dictionary with success or error data
+        """
+        value = self.unwrap(value)
+        if isinstance(value, str) and value.startswith('{') and value.endswith('}'):
+            value = Decoder.decode(value)
+        if isinstance(value, dict) and 'Type' in value and 'Data' in value:
+            return Dict(value)
+        if typ == 'Result' and not isinstance(value, dict):
+            value = Dict(Success=value is None or bool(value))
+        return Session.format(typ, name, value)
+
+    def unwrap(self, value: object) -> object:
+        """
+        Unwrap dbus types into python types.
+
+        :param value: Dbus value
+
+        :return: Python value
+        """
+        if isinstance(value, self.dbus.Boolean):
+            return bool(value)
+        if isinstance(value, dict):
+            return {str(k): self.unwrap(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.unwrap(x) for x in value]
+        if isinstance(value, str):
+            return str(value)
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return float(value)
+        return value
+
     @staticmethod
     def data(typ: str, **kwargs: dict[str, object]) -> Dict:
         """
@@ -133,10 +284,23 @@ class Session(object):
 
         :return: Dictionary with success or error data
         """
+        return Session.format(typ, 'Connector', kwargs)
+
+    @staticmethod
+    def format(typ: str, name: str, data: dict[str, object]) -> Dict:
+        """
+        Create formatted dict which matches cortile return structure.
+
+        :param typ: Type of the data
+        :param name: Name of the data
+        :param data: Payload of the data
+
+        :return: Dictionary with formatted data
+        """
         return Dict(
             Process=os.getpid(),
             Time=int(time.time_ns() / 1e6),
             Type=typ,
-            Name='Connector',
-            Data=Dict(kwargs)
+            Name=name,
+            Data=Dict(data)
         )
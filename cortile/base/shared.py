@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+from threading import Lock
+from typing import Callable, List, Tuple
+
+from cortile.helper.dict import Dict
+from cortile.helper.logger import Logger
+from cortile.helper.sampler import Sampler
+from cortile.base.connector import Connector
+
+
+class Shared(object):
+
+    LOCK = Lock()
+    CONNECTOR = None
+    REFERENCES = 0
+
+    def __init__(self, log: int = Logger.LEVELS.WARN, events: List[str] | None = None, prefetch: List[str] | None = None):
+        """
+        Initialize the shared connector.
+        This base class hands out one process wide connector to all shared instances, so
+        they use a single session, listener process and property cache, while callbacks are
+        registered and removed per instance.
+
+        :param log: Logging level, only used for the first instance, default is warn
+        :param events: Names of cortile events to listen for, added to the shared filter, default is None for all events
+        :param prefetch: Names of cortile properties fetched concurrently on connect, default is None
+        """
+        with Shared.LOCK:
+            if Shared.CONNECTOR is None or Shared.CONNECTOR.event.is_set():
+                Shared.CONNECTOR = Connector(log, events)
+                Shared.REFERENCES = 0
+            else:
+                Shared.CONNECTOR.include(events)
+            Shared.REFERENCES += 1
+            self.connector = Shared.CONNECTOR
+        self.callbacks = []
+        self.closed = False
+        if prefetch:
+            self.connector.connect()
+            self.connector.fetch(*prefetch)
+
+    def __getattr__(self, key: str) -> object:
+        """
+        Get attribute from the underlying connector.
+
+        :param key: Connector attribute key
+
+        :return: Connector attribute value
+        """
+        return getattr(self.connector, key)
+
+    def listen(self, callback: Callable[[Dict], None], *events: Tuple[str, ...], sampler: Sampler | None = None) -> None:
+        """
+        Listen asynchronously to cortile events on the shared listener process.
+
+        :param callback: Callback function for cortile action events
+        :param events: Names of cortile events, default is all events
+        :param sampler: Sampling policy applied before events are parsed, default is None
+        """
+        self.callbacks.append(callback)
+        self.connector.listen(callback, *events, sampler=sampler)
+
+    def close(self) -> None:
+        """
+        Remove the callbacks of this instance and close the connector with the last instance.
+        Closing an instance again has no effect, e.g. after wait() already closed it.
+        """
+        with Shared.LOCK:
+            if self.closed:
+                return
+            self.closed = True
+        for callback in self.callbacks:
+            self.connector.unlisten(callback)
+        self.callbacks = []
+        with Shared.LOCK:
+            last = self.connector is Shared.CONNECTOR and Shared.REFERENCES == 1
+            if self.connector is Shared.CONNECTOR:
+                Shared.REFERENCES -= 1
+            if last:
+                Shared.CONNECTOR = None
+        if not last:
+            self.connector.log.flush(1.0)
+            return
+        self.connector.close()
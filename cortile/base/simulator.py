@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+
+import json
+import time
+
+from collections import deque
+from threading import Event, Condition, current_thread
+from typing import Callable, List, Tuple
+
+from cortile.helper.dict import Dict
+from cortile.base.session import Session
+from cortile.base.player import Player
+
+
+class Simulator(Session):
+
+    LAYOUTS = ['vertical-left', 'vertical-right', 'horizontal-top', 'horizontal-bottom', 'maximized', 'fullscreen']
+
+    def __init__(self, desktops: int = 2, screens: int = 1, width: int = 1920, height: int = 1080, tiling: bool = True):
+        """
+        Initialize the simulator session.
+        This base class stands in for a session and simulates a running cortile instance in memory,
+        where desktops, screens, clients and layouts are modeled, properties are answered from the
+        model and methods are applied to it, while the resulting property events are emitted.
+
+        :param desktops: Number of desktops, default is 2
+        :param screens: Number of screens, placed side by side, default is 1
+        :param width: Width of each screen in pixels, default is 1920
+        :param height: Height of each screen in pixels, default is 1080
+        :param tiling: Enable tiling on all workspaces, default is True
+        """
+        super().__init__(native=False)
+        self.condition = Condition()
+        self.lines = deque()
+        self.player = None
+        self.busy = False
+        self.running = False
+        self.calls = []
+        self.desktops = desktops
+        self.screens = screens
+        self.width = width
+        self.height = height
+        self.desktop = 0
+        self.screen = 0
+        self.active = None
+        self.counter = 0
+        self.clients = []
+        self.workspaces = Dict()
+        for desktop in range(desktops):
+            for screen in range(screens):
+                self.workspaces[(desktop, screen)] = Dict(Tiling=tiling, Layout=0, Decoration=True, Masters=1, Slaves=3, Proportion=0.5)
+
+    @property
+    def connected(self) -> bool:
+        """
+        Flag that indicates if connect() was successful.
+
+        :return: True if the simulator is running, False otherwise
+        """
+        return self.running
+
+    def connect(self) -> Dict:
+        """
+        Start the simulator.
+
+        :return: Dictionary with success or error data
+        """
+        self.running = True
+        self.file = 'simulator'
+        return self.data('Result', Success=True)
+
+    def disconnect(self) -> None:
+        """
+        Stop the simulator, the listener ends without a disconnect event.
+        """
+        with self.condition:
+            self.running = False
+            self.file = str()
+            self.condition.notify_all()
+
+    def exit(self) -> None:
+        """
+        Simulate that cortile exits, which emits a disconnect event.
+        """
+        with self.condition:
+            self.emit('Property', 'Disconnect', Dict())
+
+    def spawn(self, cls: str, name: str = '', desktop: int | None = None, screen: int | None = None) -> int:
+        """
+        Simulate that a new client window is opened and activated.
+
+        :param cls: Window class name of the client
+        :param name: Window title of the client, default is empty
+        :param desktop: Index of the desktop, default is the current desktop
+        :param screen: Index of the screen, default is the current screen
+
+        :return: Id of the client window
+        """
+        with self.condition:
+            self.counter += 1
+            id = 0x1000000 + self.counter
+            self.clients.append(Dict(
+                Window=Dict(Id=id, Created=int(time.time_ns() / 1e6)),
+                Latest=Dict(
+                    Class=cls,
+                    Name=name,
+                    Location=Dict(Desktop=self.desktop if desktop is None else desktop, Screen=self.screen if screen is None else screen),
+                    Geometry=Dict(X=0, Y=0, Width=self.width, Height=self.height)
+                )
+            ))
+            self.active = id
+            self.changed('Clients', 'Windows')
+        return id
+
+    def kill(self, id: int) -> bool:
+        """
+        Simulate that a client window is closed.
+
+        :param id: Id of the client window
+
+        :return: True if the client was found, False otherwise
+        """
+        with self.condition:
+            client = self.client(id)
+            if client is None:
+                return False
+            self.clients.remove(client)
+            if self.active == id:
+                self.active = None
+            self.changed('Clients', 'Windows')
+        return True
+
+    def point(self, x: int, y: int, button: str | None = None) -> None:
+        """
+        Simulate that the pointer moved, which emits a pointer event and corner events.
+
+        :param x: Horizontal pointer position in pixels
+        :param y: Vertical pointer position in pixels
+        :param button: Pressed button, one of Left, Middle or Right, default is None
+        """
+        with self.condition:
+            buttons = Dict(Left=button == 'Left', Middle=button == 'Middle', Right=button == 'Right')
+            self.emit('Property', 'Pointer', Dict(Device=Dict(Button=buttons, Position=Dict(X=x, Y=y))))
+            screen = min(max(x // self.width, 0), self.screens - 1)
+            rows = ['top', 'center', 'bottom'][min(max(y * 3 // self.height, 0), 2)]
+            cols = ['left', 'center', 'right'][min(max((x - screen * self.width) * 3 // self.width, 0), 2)]
+            edges = (x - screen * self.width in [0, self.width - 1]) or (y in [0, self.height - 1])
+            if edges and (rows, cols) != ('center', 'center'):
+                self.emit('Property', 'Corner', Dict(Name=f'{rows}_{cols}', Location=Dict(Desktop=self.desktop, Screen=screen)))
+
+    def flush(self, timeout: float | None = 1.0) -> bool:
+        """
+        Wait until all emitted events are passed to the listener callback.
+
+        :param timeout: Maximum time in seconds to wait, default is 1.0
+
+        :return: True if all events are passed, False if the timeout expired
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: not (self.lines or self.busy) or not self.running, timeout)
+
+    def listen(self, callback: Callable[[Dict], None], *args: Tuple[str, ...], event: Event | None = None, raw: bool = False) -> Player:
+        """
+        Receive simulated events asynchronously.
+
+        :param callback: Callback function for cortile action events
+        :param args: Names of cortile events, default is all events
+        :param event: Optional event that is set when the simulator stops
+        :param raw: Pass raw event lines instead of parsed dictionaries, default is False
+
+        :return: Player instance that sends the events
+        """
+        player = Player(self, *map(str, args), event=event)
+        if not self.connected:
+            if raw and callable(callback):
+                callback(b'', b'Not connected', 0)
+            elif callable(callback):
+                callback(self.data('Error', Message='Not connected'))
+            if event is not None:
+                event.set()
+            return player
+        with self.condition:
+            previous, self.player = self.player, player
+            self.condition.notify_all()
+        if previous is not None:
+            previous.terminate()
+        player.communicate(callback if raw else lambda a, b, c: callback(self.parse(a, b, c)))
+        return player
+
+    def method(self, name: str, *args: Tuple[str, ...]) -> Dict:
+        """
+        Apply cortile method with arguments to the model.
+
+        :param name: Name of the cortile method
+        :param args: Arguments of the cortile method
+
+        :return: Dictionary with success or error data
+        """
+        if not self.connected:
+            return self.data('Error', Message='Not connected')
+        with self.condition:
+            self.calls.append([name, *args])
+            if name == 'ActionExecute':
+                success = self.execute(str(args[0]), int(args[1]), int(args[2]))
+            elif name == 'DesktopSwitch':
+                success = self.switch(int(args[0]))
+            elif name.startswith('Window'):
+                success = self.window(name, int(args[0]), *map(int, args[1:]))
+            else:
+                return self.data('Error', Message=f'Unknown method {name}')
+        return self.format('Result', name, Dict(Success=success))
+
+    def property(self, name: str) -> Dict:
+        """
+        Retrieve cortile property from the model.
+
+        :param name: Name of the cortile property
+
+        :return: Dictionary with success or error data
+        """
+        if not self.connected:
+            return self.data('Error', Message='Not connected')
+        with self.condition:
+            data = self.snapshot(name)
+            if data is None:
+                return self.data('Error', Message=f'Unknown property {name}')
+            line = self.encode('Property', name, data)
+        return self.parse(line, b'', 0)
+
+    def help(self) -> Dict:
+        """
+        Show the simulated desktops and screens.
+
+        :return: Dictionary with success or error data
+        """
+        return self.data('Result', Message=f'Simulator with {self.desktops} desktops and {self.screens} screens')
+
+    def next(self) -> bytes | None:
+        """
+        Wait for the next simulated event line.
+
+        :return: Raw event line or None if the simulator stopped or the listener was replaced
+        """
+        with self.condition:
+            self.busy = False
+            self.condition.notify_all()
+            while not self.lines and self.running and current_thread() is self.player:
+                self.condition.wait()
+            if not self.lines or current_thread() is not self.player:
+                return None
+            self.busy = True
+            return self.lines.popleft()
+
+    def rewind(self, line: bytes) -> None:
+        """
+        Put back an event line that was not sent.
+
+        :param line: Raw event line
+        """
+        with self.condition:
+            self.lines.appendleft(line)
+
+    def delay(self, line: bytes) -> float:
+        """
+        Simulated events are due immediately.
+
+        :param line: Raw event line
+
+        :return: Always zero
+        """
+        return 0.0
+
+    def update(self, name: str | None, line: bytes) -> None:
+        """
+        Simulated properties are answered from the model, sent event lines are not stored.
+
+        :param name: Name of the cortile event
+        :param line: Raw event line
+        """
+
+    def emit(self, typ: str, name: str, data: Dict) -> None:
+        """
+        Internal function to queue an event line for the listener.
+
+        :param typ: Type of the event
+        :param name: Name of the event
+        :param data: Payload of the event
+        """
+        if self.player is None:
+            return
+        self.lines.append(self.encode(typ, name, data))
+        self.condition.notify_all()
+
+    def encode(self, typ: str, name: str, data: Dict) -> bytes:
+        """
+        Internal function to encode an event line, which also copies the model data.
+
+        :param typ: Type of the event
+        :param name: Name of the event
+        :param data: Payload of the event
+
+        :return: Raw event line
+        """
+        return json.dumps(self.format(typ, name, data), separators=(',', ':')).encode('utf-8')
+
+    def changed(self, *names: Tuple[str, ...]) -> None:
+        """
+        Internal function to rearrange tiled clients and emit property events.
+
+        :param names: Names of the changed cortile properties
+        """
+        if 'Clients' in names or 'Workspaces' in names:
+            groups = Dict()
+            for client in self.clients:
+                location = client.Latest.Location
+                groups.setdefault((location.Desktop, location.Screen), []).append(client)
+            for location, clients in groups.items():
+                self.arrange(self.workspaces.get(location), location[1], clients)
+        for name in names:
+            self.emit('Property', name, self.snapshot(name))
+
+    def snapshot(self, name: str) -> Dict | None:
+        """
+        Internal function to create the data of a cortile property from the model, nested values are not copied.
+
+        :param name: Name of the cortile property
+
+        :return: Dictionary with property data or None
+        """
+        if name == 'Workplace':
+            return Dict(
+                DesktopCount=self.desktops,
+                ScreenCount=self.screens,
+                CurrentDesktop=self.desktop,
+                CurrentScreen=self.screen,
+                Displays=Dict(
+                    Desktops=[Dict(Geometry=Dict(X=0, Y=0, Width=self.width * self.screens, Height=self.height)) for _ in range(self.desktops)],
+                    Screens=[Dict(Geometry=self.geometry(screen)) for screen in range(self.screens)]
+                )
+            )
+        if name == 'Workspaces':
+            values = []
+            for (desktop, screen), workspace in self.workspaces.items():
+                location = Dict(Desktop=desktop, Screen=screen)
+                layouts = [Dict(Name=layout, Decoration=workspace.Decoration, Location=location) for layout in self.LAYOUTS]
+                values.append(Dict(Location=location, Tiling=workspace.Tiling, Layout=workspace.Layout, Layouts=layouts))
+            return Dict(Values=values)
+        if name == 'Clients':
+            return Dict(Values=self.clients)
+        if name == 'Windows':
+            return Dict(Active=Dict(Id=self.active))
+        return None
+
+    def execute(self, action: str, desktop: int, screen: int) -> bool:
+        """
+        Internal function to apply a cortile action on a workspace.
+
+        :param action: Name of the action, e.g. enable or layout_vertical_left
+        :param desktop: Index of the desktop
+        :param screen: Index of the screen
+
+        :return: True if the action was applied, False otherwise
+        """
+        workspace = self.workspaces.get((desktop, screen))
+        if workspace is None:
+            return False
+        if action in ['enable', 'disable', 'toggle', 'restore']:
+            workspace.Tiling = action == 'enable' or (action == 'toggle' and not workspace.Tiling)
+            self.changed('Workspaces', 'Clients')
+            return True
+        if not workspace.Tiling:
+            return False
+        clients = self.located(desktop, screen)
+        index = next((i for i, c in enumerate(clients) if c.Window.Id == self.active), None)
+        step = 1 if action.endswith(('_next', '_increase')) else -1
+        names = ['Workspaces', 'Clients']
+        if action == 'decoration':
+            workspace.Decoration = not workspace.Decoration
+        elif action == 'reset':
+            workspace.update(Layout=0, Masters=1, Slaves=3, Proportion=0.5)
+        elif action in ['cycle_next', 'cycle_previous']:
+            workspace.Layout = (workspace.Layout + step) % len(self.LAYOUTS)
+        elif action.startswith('layout_') and action[7:].replace('_', '-') in self.LAYOUTS:
+            workspace.Layout = self.LAYOUTS.index(action[7:].replace('_', '-'))
+        elif action in ['master_increase', 'master_decrease']:
+            workspace.Masters = max(workspace.Masters + step, 0)
+        elif action in ['slave_increase', 'slave_decrease']:
+            workspace.Slaves = max(workspace.Slaves + step, 1)
+        elif action in ['proportion_increase', 'proportion_decrease']:
+            workspace.Proportion = round(min(max(workspace.Proportion + step * 0.05, 0.1), 0.9), 2)
+        elif action in ['window_next', 'window_previous'] and clients:
+            self.active = clients[(index + step if index is not None else 0) % len(clients)].Window.Id
+            names = ['Windows']
+        elif action in ['screen_next', 'screen_previous'] and index is not None:
+            clients[index].Latest.Location.Screen = (screen + step) % self.screens
+            names = ['Clients']
+        elif action in ['master_make', 'master_make_next', 'master_make_previous'] and index is not None:
+            target = 0 if action == 'master_make' else (index + step) % len(clients)
+            self.swap(clients[index], clients[target])
+            names = ['Clients']
+        else:
+            return False
+        self.changed(*names)
+        return True
+
+    def switch(self, desktop: int) -> bool:
+        """
+        Internal function to switch the current desktop.
+
+        :param desktop: Index of the desktop
+
+        :return: True if the desktop exists, False otherwise
+        """
+        if not 0 <= desktop < self.desktops:
+            return False
+        self.desktop = desktop
+        self.changed('Workplace')
+        return True
+
+    def window(self, name: str, id: int, *args: Tuple[int, ...]) -> bool:
+        """
+        Internal function to apply a window method on a client.
+
+        :param name: Name of the window method, e.g. WindowActivate or WindowToDesktop
+        :param id: Id of the client window
+        :param args: Arguments of the window method
+
+        :return: True if the method was applied, False otherwise
+        """
+        client = self.client(id)
+        if client is None:
+            return False
+        location = client.Latest.Location
+        if name == 'WindowActivate':
+            workplace = (self.desktop, self.screen) != (location.Desktop, location.Screen)
+            self.active = id
+            self.desktop, self.screen = location.Desktop, location.Screen
+            self.changed(*(['Workplace'] if workplace else []), 'Windows')
+            return True
+        if name == 'WindowToDesktop' and 0 <= args[0] < self.desktops:
+            location.Desktop = args[0]
+        elif name == 'WindowToScreen' and 0 <= args[0] < self.screens:
+            location.Screen = args[0]
+        elif name == 'WindowToPosition':
+            target = next((c for c in self.located(location.Desktop, location.Screen) if c is not client and self.contains(c, *args)), None)
+            if target is not None and self.workspaces[(location.Desktop, location.Screen)].Tiling:
+                self.swap(client, target)
+            else:
+                client.Latest.Geometry.update(X=args[0], Y=args[1])
+        else:
+            return False
+        self.changed('Clients')
+        return True
+
+    def client(self, id: int) -> Dict | None:
+        """
+        Internal function to get a client by window id.
+
+        :param id: Id of the client window
+
+        :return: Client or None
+        """
+        return next((c for c in self.clients if c.Window.Id == id), None)
+
+    def located(self, desktop: int, screen: int) -> List[Dict]:
+        """
+        Internal function to get the clients of a workspace in tiling order.
+
+        :param desktop: Index of the desktop
+        :param screen: Index of the screen
+
+        :return: List of clients, masters first
+        """
+        return [c for c in self.clients if (c.Latest.Location.Desktop, c.Latest.Location.Screen) == (desktop, screen)]
+
+    def swap(self, a: Dict, b: Dict) -> None:
+        """
+        Internal function to swap the tiling order of two clients.
+
+        :param a: First client
+        :param b: Second client
+        """
+        i, j = self.clients.index(a), self.clients.index(b)
+        self.clients[i], self.clients[j] = b, a
+
+    def geometry(self, screen: int) -> Dict:
+        """
+        Internal function to get the geometry of a screen.
+
+        :param screen: Index of the screen
+
+        :return: Dictionary with position and size
+        """
+        return Dict(X=screen * self.width, Y=0, Width=self.width, Height=self.height)
+
+    def contains(self, client: Dict, x: int, y: int) -> bool:
+        """
+        Internal function to check if a position is inside a client window.
+
+        :param client: Client window
+        :param x: Horizontal position in pixels
+        :param y: Vertical position in pixels
+
+        :return: True if the position is inside, False otherwise
+        """
+        g = client.Latest.Geometry
+        return g.X <= x < g.X + g.Width and g.Y <= y < g.Y + g.Height
+
+    def arrange(self, workspace: Dict | None, screen: int, clients: List[Dict]) -> None:
+        """
+        Internal function to update the geometries of tiled clients on a workspace.
+
+        :param workspace: Workspace of the clients
+        :param screen: Index of the screen
+        :param clients: Clients of the workspace in tiling order
+        """
+        if not workspace or not workspace.Tiling:
+            return
+        area = self.geometry(screen)
+        layout = self.LAYOUTS[workspace.Layout]
+        if layout in ['maximized', 'fullscreen']:
+            for client in clients:
+                client.Latest.Geometry = Dict(area)
+            return
+        masters, slaves = clients[:workspace.Masters], clients[workspace.Masters:]
+        vertical = layout.startswith('vertical')
+        size = area.Width if vertical else area.Height
+        split = int(size * workspace.Proportion) if masters and slaves else (size if masters else 0)
+        first = layout in ['vertical-left', 'horizontal-top']
+        for group, offset, length in [(masters, 0 if first else size - split, split), (slaves, split if first else 0, size - split)]:
+            for i, client in enumerate(group):
+                if vertical:
+                    step = area.Height // len(group)
+                    client.Latest.Geometry = Dict(X=area.X + offset, Y=area.Y + i * step, Width=length, Height=step)
+                else:
+                    step = area.Width // len(group)
+                    client.Latest.Geometry = Dict(X=area.X + i * step, Y=area.Y + offset, Width=step, Height=length)
@@ -1,24 +1,43 @@
 #!/usr/bin/env python3
 
-import time
+import warnings
 
-from typing import Callable, Iterator, List
+from contextlib import contextmanager
+from threading import Thread
+from typing import TYPE_CHECKING, Callable, Iterator, List, Tuple
 
 from cortile.helper.dict import Dict
 from cortile.helper.logger import Logger
+from cortile.helper.sampler import Sampler
+from cortile.helper.buffer import Buffer
 from cortile.base.connector import Connector
+from cortile.base.batch import Batch
+from cortile.base.shared import Shared
+
+if TYPE_CHECKING:
+    from cortile.helper.recorder import Recorder
+    from cortile.base.dispatcher import Dispatcher
 
 
 class Cortile(object):
-    def __init__(self, log: int = Logger.LEVELS.WARN):
+
+    PROPERTIES = ['Workplace', 'Workspaces', 'Clients', 'Windows']
+
+    def __init__(self, log: int = Logger.LEVELS.WARN, events: List[str] | None = None, prefetch: List[str] | None = None, connector: Connector | None = None, shared: bool = False):
         """
         Initialize the cortile connector.
         This main class wraps methods of the base connector and should be
         used as primary interface to communicate with a running cortile instance.
 
         :param log: Logging level, default is warn
+        :param events: Names of cortile events to listen for, default is None for all events
+        :param prefetch: Names of properties fetched concurrently on connect, e.g. Cortile.PROPERTIES, default is None
+        :param connector: Use an existing connector instead of creating a new one, default is None
+        :param shared: Use one process wide connector with all other shared instances, default is False
         """
-        self.connector = Connector(log)
+        if connector is None and shared:
+            connector = Shared(log, events, prefetch)
+        self.connector = connector or Connector(log, events, prefetch)
 
     @property
     def log(self) -> Logger:
@@ -29,22 +48,101 @@ class Cortile(object):
         """
         return self.connector.log
 
-    def listen(self, callback: Callable[[Dict], None] | None) -> None:
+    def listen(self, callback: Callable[[Dict], None] | None, *events: Tuple[str, ...]) -> None:
         """
         Start listening for events.
 
         :param callback: Function to call when an event is received
+        :param events: Names of events passed to the callback, default is all events
+        """
+        self.connector.listen(callback, *events)
+
+    def on(self, name: str, callback: Callable[[Dict], None] | None, sampler: Sampler | None = None) -> None:
+        """
+        Start listening for events with a specific name.
+
+        :param name: Name of the event, e.g. Clients or Workspaces
+        :param callback: Function to call when the event is received
+        :param sampler: Sampling policy for high frequency events like Pointer, default is None
         """
-        self.connector.listen(callback)
+        self.connector.listen(callback, name, sampler=sampler)
 
-    def wait(self, sleep: float = 0.5) -> None:
+    def debounce(self, name: str, delay: float, limit: float | None = None) -> None:
+        """
+        Coalesce bursts of events, so that callbacks only receive the latest event of a burst.
+
+        :param name: Name of the event, e.g. Clients or Workspaces
+        :param delay: Time in seconds without new events until callbacks are executed
+        :param limit: Maximum time in seconds an event can be delayed, default is None
+        """
+        self.connector.debounce(name, delay, limit)
+
+    def pool(self, workers: int = 4, size: int = 1024, policy: str = 'block') -> 'Dispatcher':
+        """
+        Execute callbacks in a thread pool, so slow callbacks don't stall the event listener.
+        Events of each callback are still processed in order.
+
+        :param workers: Number of worker threads, default is 4
+        :param size: Maximum number of queued events, default is 1024
+        :param policy: Overflow policy, block the listener or drop the event, default is block
+
+        :return: Dispatcher instance with queue statistics
+        """
+        return self.connector.pool(workers, size, policy)
+
+    def buffer(self, size: int = 256, policy: str = 'block') -> Buffer:
+        """
+        Buffer events between the event listener and event processing.
+
+        :param size: Maximum number of buffered events, default is 256
+        :param policy: Overflow policy, one of block, drop-oldest, drop-newest or coalesce, default is block
+
+        :return: Buffer instance with queue statistics
+        """
+        return self.connector.buffer(size, policy)
+
+    def record(self, path: str, size: int = 64 * 1024 * 1024, count: int = 5) -> 'Recorder':
+        """
+        Record raw events to a compressed json lines file, e.g. for debugging or benchmarking.
+
+        :param path: Path of the recording file, e.g. events.jsonl.gz
+        :param size: Maximum uncompressed bytes per file before rotation, default is 64 MiB
+        :param count: Number of rotated files that are kept, default is 5
+
+        :return: Recorder instance with recording statistics
+        """
+        return self.connector.record(path, size, count)
+
+    def expire(self, name: str, age: float | None) -> None:
+        """
+        Set the maximum age of a cached property, older values are fetched again.
+
+        :param name: Name of the property, e.g. Clients or Windows
+        :param age: Maximum age in seconds or None to disable expiration
+        """
+        self.connector.expire(name, age)
+
+    def refresh_async(self, name: str) -> Thread:
+        """
+        Fetch a property in the background and update the cache.
+
+        :param name: Name of the property, e.g. Clients or Windows
+
+        :return: Started background thread
+        """
+        return self.connector.refresh_async(name)
+
+    def wait(self, sleep: float | None = None) -> None:
         """
         Keeps the process running for the connector to listen.
+        Blocks until a signal is received or the connection is closed.
 
-        :param sleep: Time to sleep in between, default is 0.5 seconds
+        :param sleep: Deprecated and ignored, waiting no longer polls, default is None
         """
-        while self.connector.connected and not self.connector.exit:
-            time.sleep(sleep)
+        if sleep is not None:
+            warnings.warn('Cortile.wait(sleep) is deprecated and ignored', DeprecationWarning, stacklevel=2)
+        self.connector.start()
+        self.connector.event.wait()
         self.close()
 
     def close(self) -> None:
@@ -53,6 +151,21 @@ class Cortile(object):
         """
         self.connector.close()
 
+    @contextmanager
+    def batch(self, stop: bool = False) -> Iterator['Cortile']:
+        """
+        Queue method calls and execute them back to back when the context exits.
+        The per-call results are stored in batch.results afterwards.
+
+        :param stop: Stop on the first failed method, default is False
+
+        :return: Cortile instance that queues method calls
+        """
+        batch = Cortile(connector=Batch(self.connector, stop))
+        batch.results = []
+        yield batch
+        batch.results = batch.connector.dispatch()
+
     def get_active_layout(self) -> Dict | None:
         """
         Get the active layout for the current desktop and screen.
@@ -60,12 +173,9 @@ class Cortile(object):
         :return: Active layout with tiling enabled or None
         """
         workplace = self.connector.property('Workplace')
-        if not workplace:
+        if not workplace or not self.connector.property('Workspaces'):
             return None
-        for layout in self.get_active_layouts():
-            if layout.Location.Desktop == workplace.CurrentDesktop and layout.Location.Screen == workplace.CurrentScreen:
-                return layout
-        return None
+        return self.connector.index.layout(workplace.CurrentDesktop, workplace.CurrentScreen)
 
     def get_active_layouts(self) -> Iterator[Dict]:
         """
@@ -73,13 +183,9 @@ class Cortile(object):
 
         :return: Iterator of active layouts with tiling enabled
         """
-        workspaces = self.connector.property('Workspaces')
-        if not workspaces:
+        if not self.connector.property('Workspaces'):
             return
-        for workspace in workspaces.Values:
-            if workspace.Tiling:
-                yield workspace.Layouts[workspace.Layout]
-        return
+        yield from self.connector.index.layouts()
 
     def get_active_client(self) -> Dict | None:
         """
@@ -87,12 +193,10 @@ class Cortile(object):
 
         :return: Active client or None
         """
-        clients = self.get_clients()
         windows = self.get_windows()
-        for client in clients:
-            if windows and windows.Active.Id == client.Window.Id:
-                return client
-        return None
+        if not windows or not self.connector.property('Clients'):
+            return None
+        return self.connector.index.client(windows.Active.Id)
 
     def get_active_clients(self) -> Iterator[Dict]:
         """
@@ -100,15 +204,10 @@ class Cortile(object):
 
         :return: Iterator of tracked clients on the current screen
         """
-        clients = self.connector.property('Clients')
         workplace = self.connector.property('Workplace')
-        if not clients or not workplace:
+        if not workplace or not self.connector.property('Clients'):
             return
-        for client in clients.Values:
-            location = client.Latest.Location
-            if location.Desktop == workplace.CurrentDesktop and location.Screen == workplace.CurrentScreen:
-                yield client
-        return
+        yield from self.connector.index.clients(workplace.CurrentDesktop, workplace.CurrentScreen)
 
     def get_active_desktop(self) -> int | None:
         """
@@ -187,6 +286,18 @@ class Cortile(object):
             return []
         return clients.Values
 
+    def get_clients_by_class(self, name: str) -> List[Dict]:
+        """
+        Get all the clients with a specific window class.
+
+        :param name: Case insensitive window class name
+
+        :return: List of tracked clients with the window class name
+        """
+        if not self.connector.property('Clients'):
+            return []
+        return self.connector.index.classes(name)
+
     def get_windows(self) -> Dict | None:
         """
         Get all the windows information.
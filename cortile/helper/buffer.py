@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+from collections import deque
+from threading import Condition
+
+from cortile.helper.dict import Dict
+
+
+class Buffer(object):
+
+    POLICIES = ['block', 'drop-oldest', 'drop-newest', 'coalesce']
+
+    def __init__(self, size: int = 256, policy: str = 'block'):
+        """
+        Initialize the bounded buffer.
+        This helper class queues items between a producer and a consumer thread, where
+        the policy decides if a full buffer blocks the producer, drops items or coalesces
+        items with the same key in place, the latter falls back to dropping the oldest item.
+        Items pushed with keep are never dropped or coalesced, e.g. disconnect events.
+
+        :param size: Maximum number of buffered items, default is 256
+        :param policy: Overflow policy, one of block, drop-oldest, drop-newest or coalesce, default is block
+        """
+        self.check(policy)
+        self.size = size
+        self.policy = policy
+        self.items = deque()
+        self.closed = False
+        self.condition = Condition()
+        self.stats = Dict(Depth=0, Peak=0, Pushed=0, Popped=0, Dropped=0, Coalesced=0, Blocked=0)
+
+    def configure(self, size: int, policy: str) -> None:
+        """
+        Change the size and policy, which applies to the next pushed item.
+
+        :param size: Maximum number of buffered items
+        :param policy: Overflow policy, one of block, drop-oldest, drop-newest or coalesce
+        """
+        self.check(policy)
+        with self.condition:
+            self.size = size
+            self.policy = policy
+            self.condition.notify_all()
+
+    def push(self, item: object, key: object = None, keep: bool = False) -> bool:
+        """
+        Push an item into the buffer.
+
+        :param item: Item that is buffered
+        :param key: Key used to coalesce items, default is None
+        :param keep: Never drop or coalesce the item, even if the buffer is full, default is False
+
+        :return: True if the item was buffered or coalesced, False if it was dropped
+        """
+        with self.condition:
+            if len(self.items) >= self.size and self.policy == 'block':
+                self.stats.Blocked += 1
+                while len(self.items) >= self.size and not self.closed:
+                    self.condition.wait()
+            if self.closed:
+                return False
+            if len(self.items) >= self.size:
+                if self.policy == 'drop-newest' and not keep:
+                    self.stats.Dropped += 1
+                    return False
+                if self.policy == 'coalesce' and key is not None and not keep:
+                    for i, (k, _, kept) in enumerate(self.items):
+                        if k == key and not kept:
+                            self.items[i] = (key, item, False)
+                            self.stats.Coalesced += 1
+                            self.condition.notify_all()
+                            return True
+                for i, (_, _, kept) in enumerate(self.items):
+                    if not kept:
+                        del self.items[i]
+                        self.stats.Dropped += 1
+                        break
+            self.items.append((key, item, keep))
+            self.stats.Pushed += 1
+            self.stats.Depth = len(self.items)
+            self.stats.Peak = max(self.stats.Peak, self.stats.Depth)
+            self.condition.notify_all()
+        return True
+
+    def pop(self) -> object | None:
+        """
+        Pop the oldest item from the buffer, blocks until an item is available.
+
+        :return: Oldest buffered item or None if the buffer is closed
+        """
+        with self.condition:
+            while not self.items and not self.closed:
+                self.condition.wait()
+            if self.closed:
+                return None
+            _, item, _ = self.items.popleft()
+            self.stats.Popped += 1
+            self.stats.Depth = len(self.items)
+            self.condition.notify_all()
+        return item
+
+    def close(self) -> None:
+        """
+        Close the buffer and wake up waiting threads.
+        """
+        with self.condition:
+            self.closed = True
+            self.items.clear()
+            self.stats.Depth = 0
+            self.condition.notify_all()
+
+    def check(self, policy: str) -> None:
+        """
+        Internal function to validate an overflow policy.
+
+        :param policy: Overflow policy
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unknown policy {policy}')
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import time
+import traceback
+
+from threading import Thread, Condition
+from typing import Callable
+
+from cortile.helper.logger import Logger
+
+
+class Debounce(object):
+    def __init__(self, callback: Callable[[object], None], delay: float, limit: float | None = None, log: Logger | None = None):
+        """
+        Initialize the debounce helper.
+        This helper class coalesces bursts of values and passes only the latest value
+        to the callback, once no new value was pushed within the delay or the limit is reached.
+
+        :param callback: Callback function for the latest value of a burst
+        :param delay: Time in seconds without new values until the callback is executed
+        :param limit: Maximum time in seconds a burst can be delayed, default is None
+        :param log: Logger for errors raised by the callback, default is None
+        """
+        self.callback = callback
+        self.delay = delay
+        self.limit = limit
+        self.log = log
+        self.value = None
+        self.pending = False
+        self.stopped = False
+        self.start = 0.0
+        self.deadline = 0.0
+        self.condition = Condition()
+        self.thread = None
+
+    def push(self, value: object) -> None:
+        """
+        Push a new value, which replaces a pending value.
+
+        :param value: Value passed to the callback
+        """
+        now = time.monotonic()
+        with self.condition:
+            if self.stopped:
+                return
+            if not self.pending:
+                self.start = now
+            self.deadline = now + self.delay
+            if self.limit is not None:
+                self.deadline = min(self.deadline, self.start + self.limit)
+            self.value = value
+            self.pending = True
+            if self.thread is None:
+                self.thread = Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def configure(self, delay: float, limit: float | None = None) -> None:
+        """
+        Change the delay and limit, which applies from the next pushed value.
+
+        :param delay: Time in seconds without new values until the callback is executed
+        :param limit: Maximum time in seconds a burst can be delayed, default is None
+        """
+        with self.condition:
+            self.delay = delay
+            self.limit = limit
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and drop a pending value.
+        """
+        with self.condition:
+            self.stopped = True
+            self.value, self.pending = None, False
+            self.condition.notify()
+
+    def run(self) -> None:
+        """
+        Run the background thread that executes the callback after each burst.
+        """
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopped:
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                remaining = self.deadline - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+                value, self.value, self.pending = self.value, None, False
+            try:
+                self.callback(value)
+            except Exception:
+                if self.log is not None:
+                    self.log.error('Debounce: %s', traceback.format_exc().rstrip())
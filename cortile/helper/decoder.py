@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import json
+
+from cortile.helper.dict import Dict
+
+backend = None
+
+
+class Decoder(object):
+
+    BACKEND = None
+
+    @staticmethod
+    def backend() -> object:
+        """
+        Get the json backend, which is imported on the first decode to keep the package import fast.
+        This helper uses orjson or ujson if installed and falls back to the json
+        module of the standard library, where the name of the backend is stored in BACKEND.
+
+        :return: Json backend module
+        """
+        global backend
+        try:
+            import orjson as backend
+        except ImportError:
+            try:
+                import ujson as backend
+            except ImportError:
+                backend = json
+        Decoder.BACKEND = backend.__name__
+        return backend
+
+    @staticmethod
+    def loads(data: bytes | str) -> object:
+        """
+        Decode json data into python objects.
+
+        :param data: Json data as bytes or string
+
+        :return: Decoded python object
+        """
+        return (backend or Decoder.backend()).loads(data)
+
+    @staticmethod
+    def decode(data: bytes | str) -> Dict:
+        """
+        Decode json data into a dot notation dictionary.
+        With orjson or ujson, nested dictionaries are wrapped on first access.
+
+        :param data: Json data as bytes or string
+
+        :return: Dot notation dictionary instance
+        """
+        module = backend or Decoder.backend()
+        if module is json:
+            return Dict.from_json(data)
+        return Dict.wrap(module.loads(data))
+
@@ -2,8 +2,20 @@
 
 import json
 
+from threading import Lock
+
+
+class Array(list):
+    """
+    List of a dot notation dictionary, where nested dictionaries are already wrapped.
+    Reading it again from the dictionary is a plain lookup without scanning the elements.
+    """
+
 
 class Dict(dict):
+
+    LOCK = Lock()
+
     def __init__(self, *args: tuple[object, ...], **kwargs: dict[str, object]):
         """
         Initialize a dot notation dictionary.
@@ -18,12 +30,12 @@ class Dict(dict):
             if not isinstance(arg, dict):
                 continue
             for k, v in arg.items():
+                if isinstance(v, Dict):
+                    continue
                 if isinstance(v, dict):
                     self[k] = Dict(v)
-                elif isinstance(v, list):
-                    self[k] = [Dict(x) if isinstance(x, dict) else x for x in v]
-                else:
-                    self[k] = v
+                elif type(v) is list:
+                    self[k] = Array(Dict(x) if isinstance(x, dict) and not isinstance(x, Dict) else x for x in v)
         if kwargs:
             for k, v in kwargs.items():
                 self[k] = v
@@ -32,12 +44,80 @@ class Dict(dict):
     def from_json(string: str) -> object:
         """
         Instantiate a dot notation dictionary from json string.
+        Nested objects are converted while decoding, without walking the result again.
 
         :param string: Dictionary as json string
 
         :return: Dot notation dictionary instance
         """
-        return Dict(json.loads(string))
+        return json.loads(string, object_hook=Dict.wrap)
+
+    @staticmethod
+    def wrap(value: dict) -> object:
+        """
+        Wrap a dictionary without walking nested values.
+        Nested dictionaries that are not yet converted are wrapped on first access.
+
+        :param value: Dictionary with plain or converted nested values
+
+        :return: Dot notation dictionary instance
+        """
+        result = Dict.__new__(Dict)
+        dict.update(result, value)
+        return result
+
+    def __getitem__(self, key: str) -> object:
+        """
+        Get dictionary item and wrap nested dictionaries on first access.
+        Lists are converted once into an Array, so later reads are a plain lookup.
+        Values are replaced under a lock, so concurrent readers get the same wrapped value.
+
+        :param key: Dictionary item key
+
+        :return: Dictionary item value
+        """
+        value = super().__getitem__(key)
+        if type(value) is dict or type(value) is list:
+            with Dict.LOCK:
+                value = super().__getitem__(key)
+                if type(value) is dict:
+                    value = Dict.wrap(value)
+                    super().__setitem__(key, value)
+                elif type(value) is list:
+                    value = Array(Dict.wrap(x) if type(x) is dict else x for x in value)
+                    super().__setitem__(key, value)
+        return value
+
+    def get(self, key: str, default: object = None) -> object:
+        """
+        Get dictionary item or default value if key does not exist.
+
+        :param key: Dictionary item key
+        :param default: Default value, default is None
+
+        :return: Dictionary item value
+        """
+        return self[key] if key in self else default
+
+    def values(self) -> object:
+        """
+        Get dictionary values with nested dictionaries wrapped.
+
+        :return: Dictionary values view
+        """
+        for key in self.keys():
+            self[key]
+        return super().values()
+
+    def items(self) -> object:
+        """
+        Get dictionary items with nested dictionaries wrapped.
+
+        :return: Dictionary items view
+        """
+        for key in self.keys():
+            self[key]
+        return super().items()
 
     def __getattr__(self, key: str) -> object:
         """
@@ -47,7 +127,10 @@ class Dict(dict):
 
         :return: Dictionary attribute value
         """
-        return self.__getitem__(key)
+        value = dict.__getitem__(self, key)
+        if type(value) is dict or type(value) is list:
+            return self.__getitem__(key)
+        return value
 
     def __setattr__(self, key: str, value: object) -> None:
         """
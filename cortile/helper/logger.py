@@ -2,11 +2,11 @@
 
 import os
 import sys
-import syslog
 
 from datetime import datetime
 
 from cortile.helper.dict import Dict
+from cortile.helper.sink import Sink
 
 
 class Logger(object):
@@ -32,16 +32,38 @@ class Logger(object):
         RESET='\033[0m'
     )
 
-    def __init__(self, level: int = 2):
+    def __init__(self, level: int = 2, sink: Sink | None = None):
         """
         Initialize the syslog logger.
         This helper class writes logging message to stdout and syslog, where
         outputs to stdout are highlighted by colors, depending on the severity.
+        Messages of disabled levels are dropped before any formatting is done.
 
         :param level: Logging level, default is warn
+        :param sink: Sink that writes the messages in the background, default is a new sink
         """
         self.level = level
+        self.sink = sink or Sink()
         self.pid = os.getpid()
+        self.palette = Dict(
+            DEBUG=self.COLORS.GRAY,
+            INFO=self.COLORS.CYAN,
+            WARN=self.COLORS.YELLOW,
+            ERROR=self.COLORS.MAGENTA,
+            FATAL=self.COLORS.RED
+        )
+        self.prefixes = Dict({name: self.header(name, True) for name in self.LEVELS})
+        self.plains = Dict({name: self.header(name, False) for name in self.LEVELS})
+
+    def enabled(self, level: str) -> bool:
+        """
+        Check if messages of a logging level are written.
+
+        :param level: Logging level as string
+
+        :return: True if messages are written, False otherwise
+        """
+        return self.LEVELS[level] >= self.level
 
     def color(self, level: str) -> str:
         """
@@ -51,81 +73,109 @@ class Logger(object):
 
         :return: Color value of logging level
         """
-        return Dict(
-            DEBUG=self.COLORS.GRAY,
-            INFO=self.COLORS.CYAN,
-            WARN=self.COLORS.YELLOW,
-            ERROR=self.COLORS.MAGENTA,
-            FATAL=self.COLORS.RED
-        )[level]
+        return self.palette[level]
 
-    def prefix(self, level: str, colored: bool = True) -> str:
+    def header(self, level: str, colored: bool = True) -> str:
         """
-        Get prefix header for log message.
+        Get the static part of the prefix header for log messages.
 
         :param level: Logging level as string
         :param colored: Flag indicating color usage
 
-        :return: Logging prefix string
+        :return: Logging header string with pid and level
         """
-        time = f'{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
         pid = f'{self.pid}'
         context = f'{level}'
         if colored:
-            time = f'{self.COLORS.GRAY}{time}{self.COLORS.RESET}'
             pid = f'{self.COLORS.GRAY}{pid}{self.COLORS.RESET}'
             context = f'{self.color(level)}{context}{self.COLORS.RESET}'
-        return f'{time} | {pid} | {context}'
+        return f'{pid} | {context}'
 
-    def log(self, level: str, text: str) -> None:
+    def prefix(self, level: str, colored: bool = True, time: str | None = None) -> str:
         """
-        Write message to stdout and syslog.
+        Get prefix header for log message.
 
         :param level: Logging level as string
-        :param text: Logging text as string
+        :param colored: Flag indicating color usage
+        :param time: Formatted time of the message, default is now
+
+        :return: Logging prefix string
+        """
+        if time is None:
+            time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if colored:
+            return f'{self.COLORS.GRAY}{time}{self.COLORS.RESET} | {self.prefixes[level]}'
+        return f'{time} | {self.plains[level]}'
+
+    def log(self, level: str, text: str, *args: object) -> None:
+        """
+        Queue message for stdout and syslog.
+        Arguments are only formatted into the text, if the logging level is enabled.
+
+        :param level: Logging level as string
+        :param text: Logging text as string, with optional %-style placeholders
+        :param args: Values for the placeholders in the logging text
         """
         if not (self.LEVELS[level] >= self.level):
             return
-        print(f'{self.prefix(level, True)} | {text}')
-        syslog.syslog(f'{self.prefix(level, False)} | {text}'.replace('\n', ' '))
+        if args:
+            text = text % args
+        time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.sink.push(f'{self.prefix(level, True, time)} | {text}', f'{self.prefix(level, False, time)} | {text}'.replace('\n', ' '))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all pending messages are written.
+
+        :param timeout: Maximum time in seconds to wait, default is None to wait forever
+
+        :return: True if all messages are written, False if the timeout expired
+        """
+        return self.sink.flush(timeout)
 
-    def debug(self, text: str) -> None:
+    def debug(self, text: str, *args: object) -> None:
         """
         Write debug message.
 
         :param text: Logging text as string
+        :param args: Values for %-style placeholders in the logging text
         """
-        self.log('DEBUG', text)
+        self.log('DEBUG', text, *args)
 
-    def info(self, text: str) -> None:
+    def info(self, text: str, *args: object) -> None:
         """
         Write info message.
 
         :param text: Logging text as string
+        :param args: Values for %-style placeholders in the logging text
         """
-        self.log('INFO', text)
+        self.log('INFO', text, *args)
 
-    def warn(self, text: str) -> None:
+    def warn(self, text: str, *args: object) -> None:
         """
         Write warn message.
 
         :param text: Logging text as string
+        :param args: Values for %-style placeholders in the logging text
         """
-        self.log('WARN', text)
+        self.log('WARN', text, *args)
 
-    def error(self, text: str) -> None:
+    def error(self, text: str, *args: object) -> None:
         """
         Write error message.
 
         :param text: Logging text as string
+        :param args: Values for %-style placeholders in the logging text
         """
-        self.log('ERROR', text)
+        self.log('ERROR', text, *args)
 
-    def fatal(self, text: str) -> None:
+    def fatal(self, text: str, *args: object) -> None:
         """
         Write fatal message and exit process.
 
         :param text: Logging text as string
+        :param args: Values for %-style placeholders in the logging text
         """
-        self.log('FATAL', text)
+        self.log('FATAL', text, *args)
+        self.flush(1.0)
         sys.exit(1)
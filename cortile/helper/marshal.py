@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+import struct
+
+from typing import List, Tuple
+
+
+class Marshal(object):
+
+    ALIGNMENT = {'y': 1, 'b': 4, 'n': 2, 'q': 2, 'i': 4, 'u': 4, 'x': 8, 't': 8, 'd': 8, 'h': 4, 's': 4, 'o': 4, 'g': 1, 'v': 1, 'a': 4, '(': 8, '{': 8}
+    FORMATS = {'y': 'B', 'b': 'I', 'n': 'h', 'q': 'H', 'i': 'i', 'u': 'I', 'x': 'q', 't': 'Q', 'd': 'd', 'h': 'I'}
+
+    @staticmethod
+    def split(signature: str) -> List[str]:
+        """
+        Split a dbus signature into single complete types.
+
+        :param signature: Dbus type signature, e.g. sia{sv}
+
+        :return: List of complete types, e.g. ['s', 'i', 'a{sv}']
+        """
+        types, start = [], 0
+        while start < len(signature):
+            end = Marshal.end(signature, start)
+            types.append(signature[start:end])
+            start = end
+        return types
+
+    @staticmethod
+    def end(signature: str, start: int) -> int:
+        """
+        Internal function to find the end of the complete type that begins at start.
+
+        :param signature: Dbus type signature
+        :param start: Index of the first character of the type
+
+        :return: Index after the last character of the type
+        """
+        try:
+            code = signature[start]
+            if code == 'a':
+                return Marshal.end(signature, start + 1)
+            if code in '({':
+                close, start = ')' if code == '(' else '}', start + 1
+                while signature[start] != close:
+                    start = Marshal.end(signature, start)
+                return start + 1
+        except IndexError:
+            raise ValueError(f'Invalid signature {signature}')
+        if code not in Marshal.ALIGNMENT:
+            raise ValueError(f'Invalid signature {signature}')
+        return start + 1
+
+    @staticmethod
+    def guess(value: object) -> str:
+        """
+        Guess the dbus signature of a python value, e.g. for variants or methods without introspection data.
+
+        :param value: Python value
+
+        :return: Dbus type signature
+        """
+        if isinstance(value, bool):
+            return 'b'
+        if isinstance(value, int):
+            return 'i' if -2**31 <= value < 2**31 else 'x'
+        if isinstance(value, float):
+            return 'd'
+        if isinstance(value, str):
+            return 's'
+        if isinstance(value, (bytes, bytearray)):
+            return 'ay'
+        if isinstance(value, dict):
+            return 'a{sv}'
+        if isinstance(value, (list, tuple)):
+            return 'av'
+        raise TypeError(f'Unsupported dbus value {value!r}')
+
+    @staticmethod
+    def pack(signature: str, values: List[object], buffer: bytearray | None = None, endian: str = '<') -> bytearray:
+        """
+        Marshal python values into the dbus wire format.
+        Alignment is relative to the start of the buffer, which is the start of the message or the message body.
+
+        :param signature: Dbus type signature of the values
+        :param values: Python values, one for each complete type of the signature
+        :param buffer: Existing buffer the values are appended to, default is None
+        :param endian: Byte order, < for little endian and > for big endian, default is <
+
+        :return: Buffer with the marshalled values
+        """
+        buffer = bytearray() if buffer is None else buffer
+        types = Marshal.split(signature)
+        if len(types) != len(values):
+            raise TypeError(f'Signature {signature} expects {len(types)} values, got {len(values)}')
+        for typ, value in zip(types, values):
+            Marshal.write(buffer, typ, value, endian)
+        return buffer
+
+    @staticmethod
+    def write(buffer: bytearray, typ: str, value: object, endian: str) -> None:
+        """
+        Internal function to marshal a single value of a complete type.
+
+        :param buffer: Buffer the value is appended to
+        :param typ: Complete dbus type of the value
+        :param value: Python value
+        :param endian: Byte order of the message
+        """
+        code = typ[0]
+        Marshal.pad(buffer, Marshal.ALIGNMENT[code])
+        if code in Marshal.FORMATS:
+            try:
+                buffer += struct.pack(endian + Marshal.FORMATS[code], bool(value) if code == 'b' else value)
+            except struct.error as e:
+                raise TypeError(f'Invalid dbus value {value!r} for type {typ} ({e})')
+        elif not isinstance(value, str) and code in 'sog':
+            raise TypeError(f'Invalid dbus value {value!r} for type {typ}')
+        elif code in 'so':
+            data = value.encode('utf-8')
+            buffer += struct.pack(endian + 'I', len(data)) + data + b'\0'
+        elif code == 'g':
+            data = value.encode('utf-8')
+            buffer += bytes([len(data)]) + data + b'\0'
+        elif code == 'v':
+            signature = Marshal.guess(value)
+            Marshal.write(buffer, 'g', signature, endian)
+            Marshal.write(buffer, signature, value, endian)
+        elif code == 'a':
+            item, start = typ[1:], len(buffer)
+            buffer += b'\0\0\0\0'
+            Marshal.pad(buffer, Marshal.ALIGNMENT[item[0]])
+            begin = len(buffer)
+            if item == 'y' and isinstance(value, (bytes, bytearray)):
+                buffer += value
+            elif item[0] == '{':
+                key, val = Marshal.split(item[1:-1])
+                for k, v in dict(value).items():
+                    Marshal.pad(buffer, 8)
+                    Marshal.write(buffer, key, k, endian)
+                    Marshal.write(buffer, val, v, endian)
+            else:
+                for v in value:
+                    Marshal.write(buffer, item, v, endian)
+            struct.pack_into(endian + 'I', buffer, start, len(buffer) - begin)
+        elif code == '(':
+            Marshal.pack(typ[1:-1], tuple(value), buffer, endian)
+
+    @staticmethod
+    def unpack(signature: str, data: bytes, offset: int = 0, endian: str = '<') -> Tuple[List[object], int]:
+        """
+        Unmarshal python values from the dbus wire format.
+        Alignment is relative to the start of the data, which is the start of the message.
+
+        :param signature: Dbus type signature of the values
+        :param data: Marshalled data
+        :param offset: Index of the first value in data, default is 0
+        :param endian: Byte order, < for little endian and > for big endian, default is <
+
+        :return: List of python values and the index after the last value
+        """
+        values = []
+        for typ in Marshal.split(signature):
+            value, offset = Marshal.read(data, typ, offset, endian)
+            values.append(value)
+        return values, offset
+
+    @staticmethod
+    def read(data: bytes, typ: str, offset: int, endian: str) -> Tuple[object, int]:
+        """
+        Internal function to unmarshal a single value of a complete type.
+
+        :param data: Marshalled data
+        :param typ: Complete dbus type of the value
+        :param offset: Index of the value in data
+        :param endian: Byte order of the message
+
+        :return: Python value and the index after the value
+        """
+        code = typ[0]
+        offset = Marshal.align(offset, Marshal.ALIGNMENT[code])
+        if code in Marshal.FORMATS:
+            fmt = endian + Marshal.FORMATS[code]
+            value, = struct.unpack_from(fmt, data, offset)
+            return bool(value) if code == 'b' else value, offset + struct.calcsize(fmt)
+        if code in 'so':
+            size, = struct.unpack_from(endian + 'I', data, offset)
+            return bytes(data[offset + 4:offset + 4 + size]).decode('utf-8', 'replace'), offset + 5 + size
+        if code == 'g':
+            size = data[offset]
+            return bytes(data[offset + 1:offset + 1 + size]).decode('utf-8'), offset + 2 + size
+        if code == 'v':
+            signature, offset = Marshal.read(data, 'g', offset, endian)
+            return Marshal.read(data, signature, offset, endian)
+        if code == 'a':
+            size, = struct.unpack_from(endian + 'I', data, offset)
+            item = typ[1:]
+            offset = Marshal.align(offset + 4, Marshal.ALIGNMENT[item[0]])
+            end = offset + size
+            if item == 'y':
+                return bytes(data[offset:end]), end
+            if item[0] == '{':
+                key, val = Marshal.split(item[1:-1])
+                values = {}
+                while offset < end:
+                    k, offset = Marshal.read(data, key, Marshal.align(offset, 8), endian)
+                    values[k], offset = Marshal.read(data, val, offset, endian)
+                return values, offset
+            values = []
+            while offset < end:
+                value, offset = Marshal.read(data, item, offset, endian)
+                values.append(value)
+            return values, offset
+        values, offset = Marshal.unpack(typ[1:-1], data, offset, endian)
+        return tuple(values), offset
+
+    @staticmethod
+    def align(offset: int, size: int) -> int:
+        """
+        Round an offset up to the next multiple of size.
+
+        :param offset: Offset in bytes
+        :param size: Alignment in bytes
+
+        :return: Aligned offset in bytes
+        """
+        return offset + (-offset % size)
+
+    @staticmethod
+    def pad(buffer: bytearray, size: int) -> None:
+        """
+        Append zero bytes until the buffer length is a multiple of size.
+
+        :param buffer: Buffer that is padded
+        :param size: Alignment in bytes
+        """
+        buffer += b'\0' * (-len(buffer) % size)
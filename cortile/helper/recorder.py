@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import os
+import gzip
+
+from threading import Lock
+
+from cortile.helper.dict import Dict
+
+
+class Recorder(object):
+    def __init__(self, path: str, size: int = 64 * 1024 * 1024, count: int = 5, level: int = 1):
+        """
+        Initialize the event recorder.
+        This helper class appends raw event lines of the listener process to a gzip
+        compressed json lines file, where the file is rotated once the uncompressed
+        size is exceeded and only a limited number of rotated files is kept.
+
+        :param path: Path of the recording file, e.g. events.jsonl.gz
+        :param size: Maximum uncompressed bytes per file before rotation, default is 64 MiB
+        :param count: Number of rotated files that are kept, default is 5
+        :param level: Compression level from 1 to 9, default is 1
+        """
+        self.path = path
+        self.size = size
+        self.count = count
+        self.level = level
+        self.lock = Lock()
+        self.file = None
+        self.written = 0
+        self.stats = Dict(Lines=0, Bytes=0, Rotations=0)
+        self.open()
+
+    def open(self) -> None:
+        """
+        Open a new recording file.
+        """
+        self.file = gzip.open(self.path, 'wb', compresslevel=self.level)
+        self.written = 0
+
+    def rotate(self) -> None:
+        """
+        Close the current file and shift rotated files, e.g. events.jsonl.gz to events.1.jsonl.gz.
+        """
+        self.file.close()
+        head, name = os.path.split(self.path)
+        stem, dot, tail = name.partition('.')
+        names = [os.path.join(head, f'{stem}.{i}{dot}{tail}') for i in range(self.count + 1)]
+        names[0] = self.path
+        for i in reversed(range(self.count)):
+            if os.path.exists(names[i]):
+                os.replace(names[i], names[i + 1])
+        self.stats.Rotations += 1
+        self.open()
+
+    def write(self, line: bytes) -> None:
+        """
+        Append a raw event line to the recording.
+
+        :param line: Raw event line without trailing newline
+        """
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(line + b'\n')
+            self.written += len(line) + 1
+            self.stats.Lines += 1
+            self.stats.Bytes += len(line) + 1
+            if self.written >= self.size:
+                self.rotate()
+
+    def close(self) -> None:
+        """
+        Flush and close the recording file.
+        """
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.close()
+            self.file = None
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import re
+import math
+import time
+
+from typing import Callable
+
+
+class Sampler(object):
+
+    NAME = re.compile(rb'"Name"\s*:\s*"(\w+)"')
+
+    def __init__(self, rate: float | None = None, button: bool = False, distance: float | None = None):
+        """
+        Initialize the sampler helper.
+        This helper class decides if high frequency events like pointer events are delivered,
+        where the rate limits all events and button or distance changes trigger a delivery.
+
+        :param rate: Maximum number of delivered events per second, default is None
+        :param button: Deliver pointer events only on button state changes, default is False
+        :param distance: Deliver pointer events only if the position moved by pixels, default is None
+        """
+        self.interval = 1.0 / rate if rate else 0.0
+        self.button = button
+        self.distance = distance
+        self.last = -math.inf
+        self.buttons = None
+        self.position = None
+
+    def accept(self, load: Callable[[], dict]) -> bool:
+        """
+        Check if an event is delivered.
+
+        :param load: Function that returns the decoded event, only called if required
+
+        :return: True if the event is delivered, False otherwise
+        """
+        now = time.monotonic()
+        if now - self.last < self.interval:
+            return False
+        if self.button or self.distance:
+            device = (load().get('Data') or {}).get('Device') or {}
+            buttons = device.get('Button')
+            position = device.get('Position') or {}
+            position = (position.get('X', 0), position.get('Y', 0))
+            moved = self.distance and (self.position is None or math.dist(position, self.position) >= self.distance)
+            clicked = self.button and buttons != self.buttons
+            if not (moved or clicked):
+                return False
+            if moved:
+                self.position = position
+            if clicked:
+                self.buttons = buttons
+        self.last = now
+        return True
+
+    @staticmethod
+    def peek(line: bytes) -> str | None:
+        """
+        Extract the event name from a raw event line without decoding it.
+
+        :param line: Raw event line as json bytes
+
+        :return: Name of the event or None
+        """
+        match = Sampler.NAME.search(line)
+        return match.group(1).decode('utf-8') if match else None
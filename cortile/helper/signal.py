@@ -3,17 +3,21 @@
 import sys
 import signal
 
+from threading import Event
 from types import FrameType
 
 
 class Signal(object):
-    def __init__(self):
+    def __init__(self, event: Event | None = None):
         """
         Initialize the signal handler.
         This helper class manages sigint and sigterm events to signal whether
         an application exit has been requested, ensuring a gracefully termination.
+
+        :param event: Optional event that is set when a signal is received
         """
         self.sigcount = 0
+        self.event = event
         signal.signal(signal.SIGINT, self.sig)
         signal.signal(signal.SIGTERM, self.sig)
 
@@ -25,6 +29,8 @@ class Signal(object):
         :param frame: Signal frame, not used
         """
         self.sigcount += 1
+        if self.event is not None:
+            self.event.set()
         if self.sigcount > 2:
             sys.exit(0)
 
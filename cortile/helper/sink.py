@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+import sys
+import atexit
+import syslog
+
+from collections import deque
+from threading import Thread, Condition
+from typing import List, Tuple
+
+from cortile.helper.dict import Dict
+
+
+class Sink(object):
+    def __init__(self, size: int = 1024):
+        """
+        Initialize the logging sink.
+        This helper class writes log lines to stdout and syslog on a background thread,
+        where pending lines are written in batches and new lines are dropped if the
+        bounded queue is full, so logging threads never block on output.
+
+        :param size: Maximum number of pending lines, default is 1024
+        """
+        self.size = size
+        self.lines = deque()
+        self.thread = None
+        self.busy = False
+        self.dead = False
+        self.closed = False
+        self.condition = Condition()
+        self.stats = Dict(Written=0, Dropped=0, Batches=0)
+
+    def push(self, line: str, plain: str) -> bool:
+        """
+        Queue a log line for writing.
+
+        :param line: Colored line written to stdout
+        :param plain: Plain line written to syslog
+
+        :return: True if the line was queued, False if it was dropped
+        """
+        with self.condition:
+            if self.closed or self.dead or len(self.lines) >= self.size:
+                self.stats.Dropped += 1
+                return False
+            self.lines.append((line, plain))
+            if self.thread is None:
+                self.thread = Thread(target=self.run, daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+            self.condition.notify_all()
+        return True
+
+    def run(self) -> None:
+        """
+        Write pending lines in batches until the sink is closed.
+        If writing fails, e.g. on a broken stdout pipe, pending lines are dropped and the sink stops.
+        """
+        while True:
+            with self.condition:
+                while not self.lines and not self.closed:
+                    self.condition.wait()
+                if not self.lines:
+                    return
+                lines, self.lines = list(self.lines), deque()
+                self.busy = True
+            try:
+                self.write(lines)
+            except Exception:
+                with self.condition:
+                    self.dead = True
+                    self.busy = False
+                    self.stats.Dropped += len(lines) + len(self.lines)
+                    self.lines.clear()
+                    self.condition.notify_all()
+                return
+            with self.condition:
+                self.busy = False
+                self.stats.Written += len(lines)
+                self.stats.Batches += 1
+                self.condition.notify_all()
+
+    def write(self, lines: List[Tuple[str, str]]) -> None:
+        """
+        Write a batch of lines to stdout and syslog.
+
+        :param lines: List of colored and plain lines
+        """
+        sys.stdout.write(''.join(f'{line}\n' for line, _ in lines))
+        sys.stdout.flush()
+        for _, plain in lines:
+            syslog.syslog(plain)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all pending lines are written.
+
+        :param timeout: Maximum time in seconds to wait, default is None to wait forever
+
+        :return: True if all lines are written, False if the timeout expired
+        """
+        with self.condition:
+            if self.thread is None:
+                return True
+            return self.condition.wait_for(lambda: self.dead or not (self.lines or self.busy), timeout)
+
+    def close(self, timeout: float | None = 1.0) -> None:
+        """
+        Write pending lines and stop the background thread.
+
+        :param timeout: Maximum time in seconds to wait for pending lines, default is 1.0
+        """
+        self.flush(timeout)
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
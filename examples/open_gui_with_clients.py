@@ -31,8 +31,8 @@ from cortile import Cortile
 
 def main():
 
-    # init a cortile python object and connect to the running cortile process
-    ct = Cortile()
+    # init a cortile python object and connect to the running cortile process, required properties are fetched concurrently
+    ct = Cortile(prefetch=['Workplace', 'Clients'])
 
     # retrieve the screen dimension of the currently active screen
     screens = ct.get_screen_dimensions()
@@ -26,6 +26,7 @@ Usage:
 
 from cortile import Cortile
 from cortile.helper.dict import Dict
+from cortile.helper.sampler import Sampler
 
 
 def main():
@@ -33,20 +34,13 @@ def main():
     # init a cortile python object and connect to the running cortile process
     ct = Cortile()
 
-    # listen to cortile events, the lambda function just passes the cortile and event object
-    ct.listen(lambda event: event_callback(ct, event))
+    # listen to pointer events, the sampler drops all events where the button state did not change
+    ct.on('Pointer', lambda event: handle_pointer_clicks(ct, event), sampler=Sampler(button=True))
 
     # this prevents the main method from exiting and therefore keeps the script running
     ct.wait()
 
 
-def event_callback(ct: Cortile, event: Dict):
-
-    # the callback will fire on all events, here we are only interested on pointer events
-    if event.Name == 'Pointer':
-        handle_pointer_clicks(ct, event)
-
-
 def handle_pointer_clicks(ct: Cortile, event: Dict):
 
     # receive the pointer event data
@@ -34,6 +34,9 @@ def main():
     # init a cortile python object and connect to the running cortile process
     ct = Cortile()
 
+    # coalesce bursts of workspace updates, the state files are written once per burst (at the latest after 1s)
+    ct.debounce('Workspaces', delay=0.2, limit=1.0)
+
     # listen to cortile events, the lambda function just passes the cortile and event object
     ct.listen(lambda event: event_callback(ct, event))
 
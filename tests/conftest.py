@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import time
+
+import pytest
+
+from typing import Callable
+
+from cortile import Cortile
+from cortile.base.connector import Connector
+from cortile.base.simulator import Simulator
+
+
+@pytest.fixture
+def until() -> Callable[[Callable[[], bool], float], bool]:
+    """
+    Wait until a condition is met, e.g. for events processed on background threads.
+    The returned function takes the condition and a timeout in seconds, default is 2.0,
+    and returns True if the condition is met or False if the timeout expired.
+    """
+    def wait(condition: Callable[[], bool], timeout: float = 2.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+    return wait
+
+
+@pytest.fixture
+def simulator() -> Simulator:
+    """
+    Simulated cortile instance with two desktops and one screen.
+    """
+    return Simulator(desktops=2, screens=1)
+
+
+@pytest.fixture
+def ct(simulator: Simulator) -> Cortile:
+    """
+    Cortile instance connected to the simulator, closed after the test.
+    """
+    ct = Cortile(connector=Connector(session=simulator))
+    yield ct
+    ct.close()
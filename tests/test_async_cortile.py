@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from cortile import AsyncCortile
+
+
+class Collector(object):
+    def __init__(self):
+        """
+        Initialize the collecting connector.
+        This helper class collects batched method calls instead of running the cortile dbus client.
+        """
+        self.calls = []
+
+    async def batch(self, calls, stop=False):
+        self.calls.extend(calls)
+        return [True] * len(calls)
+
+
+def test_batch():
+    connector = Collector()
+    ct = AsyncCortile(connector=connector)
+
+    async def run():
+        async with ct.batch() as batch:
+            assert await batch.desktop_switch(1) is None
+            assert await batch.action_execute_toggle(0, 0) is None
+            assert connector.calls == []
+        return batch
+
+    batch = asyncio.run(run())
+    assert connector.calls == [['DesktopSwitch', 1], ['ActionExecute', 'toggle', 0, 0]]
+    assert batch.results == [True, True]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import sys
+import shutil
+import subprocess
+
+import pytest
+
+from threading import Thread
+
+from cortile.helper.marshal import Marshal
+from cortile.base.bus import Bus, DBusException
+from cortile.base.session import Session
+
+NAME = 'com.github.leukipp.cortile'
+INTROSPECTION = f'''<node>
+  <interface name="{NAME}">
+    <method name="DesktopSwitch"><arg name="desktop" type="i" direction="in"/><arg type="b" direction="out"/></method>
+  </interface>
+</node>'''
+
+
+class Service(Bus):
+    def __init__(self, address: str):
+        """
+        Initialize the cortile service.
+        This test class answers introspection, the Process and Workplace properties and DesktopSwitch calls.
+
+        :param address: Dbus address of the test bus
+        """
+        super().__init__(address)
+        self.calls = []
+        self.senders = set()
+
+    def dispatch(self, typ, serial, fields, values):
+        if typ != 1:
+            return super().dispatch(typ, serial, fields, values)
+        self.senders.add(fields[7])
+        reply = [(5, 'u', serial), (6, 's', fields[7])]
+        if fields[3] == 'Introspect':
+            return self.send(2, reply, 's', [INTROSPECTION])
+        if fields[3] == 'Get' and values[1] == 'Process':
+            return self.send(2, reply, 'v', [{'Path': sys.executable}])
+        if fields[3] == 'Get':
+            return self.send(2, reply, 'v', ['{"CurrentDesktop": 1, "CurrentScreen": 0}'])
+        self.calls.append([fields[3], *values])
+        self.send(2, reply, 'b', [True])
+
+
+@pytest.fixture
+def address(monkeypatch):
+    """
+    Private session bus with a cortile service, used instead of dbus-python.
+    """
+    if shutil.which('dbus-daemon') is None:
+        pytest.skip('dbus-daemon is not installed')
+    daemon = subprocess.Popen(['dbus-daemon', '--session', '--nofork', '--print-address=1'], stdout=subprocess.PIPE)
+    address = daemon.stdout.readline().decode().strip()
+    monkeypatch.setenv('DBUS_SESSION_BUS_ADDRESS', address)
+    monkeypatch.setitem(sys.modules, 'dbus', None)
+    monkeypatch.setattr(Bus, 'SESSION', None)
+    yield address
+    if Bus.SESSION is not None:
+        Bus.SESSION.close()
+    daemon.terminate()
+    daemon.wait()
+
+
+@pytest.fixture
+def service(address):
+    """
+    Cortile service registered on the private session bus.
+    """
+    service = Service(address)
+    service.connect()
+    service.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'RequestName', 'su', (NAME, 0))
+    yield service
+    service.close()
+
+
+def test_marshal():
+    signature = 'ybnqiuxtdsoga{sv}a(is)v'
+    values = [1, True, -2, 3, -4, 5, -6, 7, 0.5, 'text', '/a/b', 'as', {'Id': 1, 'Name': 'xterm', 'Tiled': False, 'Size': [1, 2]}, [(1, 'a'), (2, 'b')], 'variant']
+    data = Marshal.pack(signature, values)
+    assert Marshal.unpack(signature, data) == (values[:13] + [[(1, 'a'), (2, 'b')], 'variant'], len(data))
+    assert Marshal.unpack(signature, Marshal.pack(signature, values, endian='>'), endian='>')[0] == Marshal.unpack(signature, data)[0]
+
+
+def test_marshal_errors():
+    with pytest.raises(TypeError):
+        Marshal.pack('s', [1])
+    with pytest.raises(TypeError):
+        Marshal.pack('i', ['1'])
+    with pytest.raises(TypeError):
+        Marshal.pack('ii', [1])
+    with pytest.raises(ValueError):
+        Marshal.pack('a{s', [{}])
+
+
+def test_session(service):
+    session = Session()
+    assert session.connect().Data.Success
+    assert session.method('DesktopSwitch', 1).Data.Success
+    assert session.property('Workplace').Data.CurrentDesktop == 1
+    assert service.calls == [['DesktopSwitch', 1]]
+
+
+def test_pipelined_calls(service):
+    session = Session()
+    session.connect()
+    results = []
+    threads = [Thread(target=lambda: results.extend(session.method('DesktopSwitch', i).Data.Success for i in range(25))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 100
+    assert len(service.calls) == 100
+    assert len(service.senders) == 1
+
+
+def test_errors(service):
+    bus = Bus.session()
+    with pytest.raises(DBusException) as error:
+        bus.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'GetNameOwner', 's', ('com.github.missing',))
+    assert error.value.get_dbus_name() == 'org.freedesktop.DBus.Error.NameHasNoOwner'
+    bus.close()
+    with pytest.raises(DBusException) as error:
+        bus.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'GetId')
+    assert error.value.get_dbus_name() == 'org.freedesktop.DBus.Error.Disconnected'
+    assert Bus.session() is not bus
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import time
+
+from cortile.helper.dict import Dict
+from cortile.base.cache import Cache
+
+
+def test_set_older():
+    cache = Cache()
+    assert cache.set('Clients', Dict(Values=[2]), 2000)
+    assert not cache.set('Clients', Dict(Values=[1]), 1000)
+    assert cache.get('Clients').Values == [2]
+    assert cache.set('Clients', Dict(Values=[3]), 2000)
+    assert cache.get('Clients').Values == [3]
+
+
+def test_stale():
+    cache = Cache()
+    now = int(time.time_ns() / 1e6)
+    cache.set('Clients', Dict(), now - 5000)
+    assert not cache.stale('Clients')
+    cache.expire('Clients', 10.0)
+    assert not cache.stale('Clients')
+    cache.expire('Clients', 1.0)
+    assert cache.stale('Clients')
+    assert cache.get('Clients') is None
+    assert cache.stats.Stale == 1
+    cache.expire('Clients', None)
+    assert cache.get('Clients') is not None
+
+
+def test_default_age():
+    cache = Cache(default=1.0)
+    now = int(time.time_ns() / 1e6)
+    cache.set('Clients', Dict(), now)
+    cache.set('Workplace', Dict(), now - 5000)
+    assert not cache.stale('Clients')
+    assert cache.stale('Workplace')
+    cache.expire('Workplace', 10.0)
+    assert not cache.stale('Workplace')
+
+
+def test_invalidate():
+    cache = Cache()
+    cache.set('Clients', Dict())
+    cache.set('Workplace', Dict())
+    cache.expire('Clients', 10.0)
+    cache.invalidate()
+    assert cache.stale('Clients')
+    assert not cache.stale('Workplace')
+    cache.set('Clients', Dict())
+    assert not cache.stale('Clients')
+
+
+def test_stats():
+    cache = Cache()
+    assert cache.get('Clients') is None
+    cache.set('Clients', Dict())
+    assert cache.get('Clients') is not None
+    assert cache.stats.Misses == 1
+    assert cache.stats.Hits == 1
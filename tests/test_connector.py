@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from threading import Thread
+
+from cortile.base.connector import Connector
+from cortile.base.simulator import Simulator
+
+
+class Offline(Simulator):
+    def __init__(self, failures: int = 1):
+        """
+        Initialize the offline simulator.
+        This test class fails to connect a number of times before it starts.
+
+        :param failures: Number of failed connects, default is 1
+        """
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+
+    def connect(self):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            return self.data('Error', Message='Offline')
+        return super().connect()
+
+
+def test_connect_failure_on_thread():
+    session = Offline()
+    connector = Connector(session=session)
+    results = []
+    thread = Thread(target=lambda: results.append(connector.property('Workplace')))
+    thread.start()
+    thread.join()
+    assert results == [None]
+    assert not connector.ready
+    assert connector.property('Workplace').CurrentDesktop == 0
+    assert connector.ready
+    assert session.attempts == 2
+    connector.close()
+
+
+def test_connect_failure_on_main_thread():
+    connector = Connector(session=Offline())
+    with pytest.raises(SystemExit):
+        connector.property('Workplace')
+    assert not connector.ready
+
+
+def test_prefetch_without_listener(simulator):
+    connector = Connector(prefetch=['Clients', 'Workplace'], session=simulator)
+    simulator.spawn('xterm')
+    assert connector.ready
+    assert not connector.started
+    assert simulator.player is None
+    assert connector.signal is None
+    assert connector.properties.Workplace.CurrentDesktop == 0
+    assert len(connector.properties.Clients.Values) == 0
+    connector.close()
+
+
+def test_event_filter(simulator):
+    clients = []
+    connector = Connector(events=['Clients'], session=simulator)
+    connector.listen(clients.append, 'Clients')
+    assert simulator.player.names == {'Clients', 'Disconnect'}
+    simulator.point(0, 0)
+    simulator.spawn('xterm')
+    simulator.flush()
+    assert [event.Name for event in clients] == ['Clients']
+    assert connector.process.stats.Lines == 1
+    assert connector.tracked('Clients')
+    assert not connector.tracked('Workplace')
+    connector.close()
+
+
+def test_event_filter_restart(simulator):
+    pointers = []
+    connector = Connector(events=['Clients'], session=simulator)
+    connector.start()
+    previous = connector.process
+    connector.listen(pointers.append, 'Pointer')
+    assert connector.process is not previous
+    assert not previous.running
+    assert connector.filter() == ['Clients', 'Disconnect', 'Pointer']
+    simulator.point(0, 0)
+    simulator.flush()
+    assert len(pointers) == 1
+    current = connector.process
+    connector.listen(pointers.append, 'Clients')
+    assert connector.process is current
+    connector.include(None)
+    assert connector.filter() == []
+    assert simulator.player.names == set()
+    assert not connector.event.is_set()
+    connector.close()
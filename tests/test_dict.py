@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+import json
+
+from cortile.helper.dict import Dict, Array
+from cortile.helper.decoder import Decoder
+
+
+def test_wrap_nested_values():
+    data = Decoder.decode(json.dumps({'Values': [1, {'Window': {'Id': 7}}], 'Data': {'Name': 'x'}}))
+    assert data.Values[1].Window.Id == 7
+    assert data.Data.Name == 'x'
+    assert isinstance(data.Values[1], Dict)
+
+
+def test_wrap_lists_once():
+    data = Dict.wrap({'Values': [{'Id': 1}, {'Id': 2}]})
+    values = data.Values
+    assert type(values) is Array
+    assert data.Values is values
+    assert [value.Id for value in values] == [1, 2]
+
+
+def test_init_lists():
+    data = Dict({'Values': [1, {'Id': 2}]}, Name='x')
+    assert data.Values[1].Id == 2
+    assert data.Name == 'x'
+    assert json.loads(str(data)) == {'Values': [1, {'Id': 2}], 'Name': 'x'}
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+from cortile.helper.dict import Dict
+from cortile.base.index import Index
+
+
+def test_clients(simulator):
+    index = Index()
+    xterm = simulator.spawn('XTerm')
+    firefox = simulator.spawn('firefox', desktop=1)
+    index.update('Clients', simulator.snapshot('Clients'))
+    assert index.client(xterm).Latest.Class == 'XTerm'
+    assert index.client(0x7fffffff) is None
+    assert [client.Window.Id for client in index.clients(0, 0)] == [xterm]
+    assert [client.Window.Id for client in index.clients(1, 0)] == [firefox]
+    assert index.clients(1, 1) == []
+    assert [client.Window.Id for client in index.classes('xterm')] == [xterm]
+
+
+def test_layouts(simulator):
+    index = Index()
+    workspaces = simulator.snapshot('Workspaces')
+    workspaces.Values[1].Tiling = False
+    index.update('Workspaces', workspaces)
+    assert [(layout.Location.Desktop, layout.Location.Screen) for layout in index.layouts()] == [(0, 0)]
+    assert index.layout(0, 0).Name == workspaces.Values[0].Layouts[workspaces.Values[0].Layout].Name
+    assert index.layout(1, 0) is None
+
+
+def test_rebuild(simulator):
+    index = Index()
+    index.update('Clients', simulator.snapshot('Clients'))
+    assert index.classes('xterm') == []
+    table = index.table('Clients')
+    assert index.table('Clients') is table
+    simulator.spawn('xterm')
+    index.update('Clients', simulator.snapshot('Clients'))
+    assert index.table('Clients') is not table
+    assert len(index.classes('XTERM')) == 1
+
+
+def test_ignored():
+    index = Index()
+    index.update('Workplace', Dict(CurrentDesktop=0))
+    assert 'Workplace' not in index.sources
+    assert index.layouts() == []
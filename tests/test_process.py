@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+from threading import Event
+
+from cortile.base.process import Process
+
+
+def test_lines():
+    lines, done = [], Event()
+    process = Process('sh', '-c', 'printf "a\\n\\nb\\n"; sleep 0.05; printf "c\\nd"', event=done)
+    process.communicate(lambda stdout, stderr, code: lines.append(stdout))
+    assert done.wait(2.0)
+    assert lines == [b'a', b'b', b'c', b'd']
+    assert process.stats.Lines == 4
+    assert process.stats.Bytes == 8
+    assert not process.running
+
+
+def test_communicate():
+    stdout, stderr, code = Process('sh', '-c', 'echo out; echo err >&2; exit 3').communicate()
+    assert (stdout, stderr, code) == (b'out\n', b'err\n', 3)
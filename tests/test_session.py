@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import os
+
+import pytest
+
+from cortile.base import bus
+from cortile.base.session import Session
+
+CLIENT = '''#!/bin/sh
+echo "$@" >> {calls}
+echo '{{"Process": 1, "Time": 1, "Type": "Result", "Name": "Client", "Data": {{"Success": true}}}}'
+'''
+
+
+class Proxy(object):
+    def __init__(self, error: Exception | None = None):
+        """
+        Initialize the dbus proxy.
+        This test class returns True for every method or raises the given error.
+
+        :param error: Error raised by method calls, default is None
+        """
+        self.error = error
+        self.calls = []
+
+    def get_dbus_method(self, name, interface):
+        def method(*args):
+            self.calls.append([name, *args])
+            if self.error is not None:
+                raise self.error
+            return bus.Boolean(True)
+        return method
+
+
+@pytest.fixture
+def session(tmp_path):
+    """
+    Session with a cortile dbus client script, which records its arguments.
+    """
+    client = tmp_path / 'cortile'
+    client.write_text(CLIENT.format(calls=tmp_path / 'calls'))
+    os.chmod(client, 0o755)
+    session = Session()
+    session.dbus = bus
+    session.file = str(client)
+    return session
+
+
+def calls(session):
+    """
+    Arguments of all cortile dbus client calls, one line for each call.
+    """
+    path = os.path.join(os.path.dirname(session.file), 'calls')
+    return open(path).read().split('\n')[:-1] if os.path.exists(path) else []
+
+
+def test_proxy(session):
+    session.proxy = Proxy()
+    result = session.method('DesktopSwitch', 1)
+    assert result.Type == 'Result' and result.Name == 'DesktopSwitch' and result.Data.Success
+    assert session.proxy.calls == [['DesktopSwitch', 1]]
+    assert calls(session) == []
+
+
+@pytest.mark.parametrize('error', [bus.DBusException('', 'org.freedesktop.DBus.Error.ServiceUnknown'), TypeError('signature'), ValueError('signature')])
+def test_fallback(session, error):
+    session.proxy = Proxy(error)
+    result = session.method('DesktopSwitch', 1)
+    assert result.Name == 'Client' and result.Data.Success
+    assert calls(session) == ['dbus -method DesktopSwitch 1']
+
+
+@pytest.mark.parametrize('name', ['org.freedesktop.DBus.Error.NoReply', 'org.freedesktop.DBus.Error.Failed'])
+def test_no_retry(session, name):
+    session.proxy = Proxy(bus.DBusException('failed', name))
+    result = session.method('DesktopSwitch', 1)
+    assert result.Type == 'Error' and name in result.Data.Message
+    assert session.proxy.calls == [['DesktopSwitch', 1]]
+    assert calls(session) == []
+
+
+def test_not_native(session):
+    session.native = False
+    session.proxy = Proxy()
+    assert session.method('DesktopSwitch', 1).Name == 'Client'
+    assert session.proxy.calls == []
+    assert calls(session) == ['dbus -method DesktopSwitch 1']
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from cortile.base.shared import Shared
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    """
+    Start and end each test without a process wide connector.
+    """
+    Shared.CONNECTOR, Shared.REFERENCES = None, 0
+    yield
+    Shared.CONNECTOR, Shared.REFERENCES = None, 0
+
+
+def test_references():
+    a, b = Shared(), Shared()
+    assert a.connector is b.connector
+    assert Shared.REFERENCES == 2
+    a.close()
+    assert Shared.REFERENCES == 1
+    assert Shared.CONNECTOR is b.connector
+    b.close()
+    assert Shared.REFERENCES == 0
+    assert Shared.CONNECTOR is None
+
+
+def test_close_twice():
+    a, b = Shared(), Shared()
+    a.close()
+    a.close()
+    assert Shared.REFERENCES == 1
+    assert Shared.CONNECTOR is b.connector
+    assert not b.connector.event.is_set()
+    b.close()
+    assert Shared.CONNECTOR is None
+
+
+def test_closed_connector():
+    a = Shared()
+    a.close()
+    b = Shared()
+    assert b.connector is not a.connector
+    assert Shared.REFERENCES == 1
+    b.close()
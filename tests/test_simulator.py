@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import gzip
+import json
+
+from threading import Event
+
+from cortile import Cortile
+from cortile.helper.sampler import Sampler
+from cortile.helper.buffer import Buffer
+from cortile.base.connector import Connector
+from cortile.base.replay import Replay
+
+
+def test_batch(ct, simulator):
+    simulator.spawn('firefox')
+    with ct.batch() as batch:
+        batch.desktop_switch(1)
+        batch.action_execute_toggle(0, 0)
+    assert batch.results == [True, True]
+    assert simulator.calls == [['DesktopSwitch', 1], ['ActionExecute', 'toggle', 0, 0]]
+    assert ct.get_active_desktop() == 1
+
+
+def test_batch_stop(ct, simulator):
+    with ct.batch(stop=True) as batch:
+        batch.window_activate(0x7fffffff)
+        batch.desktop_switch(1)
+    assert batch.results == [False, None]
+    assert [call[0] for call in simulator.calls] == ['WindowActivate']
+
+
+def test_delta_events(ct, simulator):
+    added, removed = [], []
+    ct.on('ClientAdded', added.append)
+    ct.on('ClientRemoved', removed.append)
+    firefox = simulator.spawn('firefox')
+    simulator.spawn('xterm')
+    simulator.kill(firefox)
+    simulator.flush()
+    assert [event.Data.Latest.Class for event in added] == ['firefox', 'xterm']
+    assert [event.Data.Window.Id for event in removed] == [firefox]
+
+
+def test_delta_events_after_refresh(ct, simulator):
+    added, stall = [], Event()
+    ct.on('ClientAdded', added.append)
+    ct.on('Pointer', lambda event: stall.wait(2.0))
+    simulator.spawn('a')
+    simulator.flush()
+    simulator.point(0, 0)
+    simulator.spawn('b')
+    ct.refresh_async('Clients').join()
+    stall.set()
+    simulator.flush()
+    assert [event.Data.Latest.Class for event in added] == ['a', 'b']
+
+
+def test_debounce(ct, simulator, until):
+    events = []
+    ct.on('Clients', events.append)
+    ct.debounce('Clients', 0.1)
+    for i in range(5):
+        simulator.spawn(f'Client{i}')
+    simulator.flush()
+    assert until(lambda: events)
+    assert not until(lambda: len(events) > 1, 0.3)
+    assert len(events[0].Data.Values) == 5
+    assert len(ct.get_clients()) == 5
+
+
+def test_debounce_errors(ct, simulator, until):
+    events = []
+
+    def callback(event):
+        events.append(event)
+        raise RuntimeError('callback failed')
+
+    ct.on('Clients', callback)
+    ct.debounce('Clients', 0.01)
+    ct.debounce('Clients', 0.02)
+    simulator.spawn('firefox')
+    assert until(lambda: len(events) == 1)
+    simulator.spawn('xterm')
+    assert until(lambda: len(events) == 2)
+    assert len(ct.connector.debounces) == 1
+
+
+def test_sampler(ct, simulator):
+    events = []
+    ct.on('Pointer', events.append, sampler=Sampler(distance=100))
+    for x in range(0, 400, 10):
+        simulator.point(x, 500)
+    simulator.flush()
+    assert [event.Data.Device.Position.X for event in events] == [0, 100, 200, 300]
+
+
+def test_sampler_button(ct, simulator):
+    events = []
+    ct.on('Pointer', events.append, sampler=Sampler(button=True))
+    simulator.point(10, 10)
+    simulator.point(20, 20)
+    simulator.point(30, 30, 'Left')
+    simulator.point(40, 40, 'Left')
+    simulator.point(50, 50)
+    simulator.flush()
+    assert [event.Data.Device.Position.X for event in events] == [10, 30, 50]
+
+
+def test_pool(ct, simulator, until):
+    events, failures = [], []
+
+    def failing(event):
+        failures.append(event)
+        raise RuntimeError('callback failed')
+
+    dispatcher = ct.pool(2)
+    ct.on('Pointer', events.append)
+    ct.on('Pointer', failing)
+    for x in range(50):
+        simulator.point(x, 0)
+    simulator.flush()
+    assert until(lambda: dispatcher.stats.Executed == 100)
+    assert [event.Data.Device.Position.X for event in events] == list(range(50))
+    assert len(failures) == 50
+    assert dispatcher.stats.Errors == 50
+
+
+def test_pool_replaced(ct, simulator, until):
+    events = []
+    previous = ct.pool(2)
+    dispatcher = ct.pool(1)
+    assert previous.executor._shutdown
+    ct.on('Pointer', events.append)
+    simulator.point(0, 0)
+    simulator.flush()
+    assert until(lambda: dispatcher.stats.Executed == 1)
+    assert len(events) == 1
+    assert previous.stats.Submitted == 0
+
+
+def test_buffer(ct, simulator, until):
+    events = []
+    ct.on('Pointer', events.append)
+    queue = ct.buffer(4)
+    assert ct.buffer(8) is queue
+    for x in range(100):
+        simulator.point(x, 0)
+    simulator.flush()
+    assert until(lambda: len(events) == 100)
+    assert [event.Data.Device.Position.X for event in events] == list(range(100))
+    assert queue.size == 8
+    assert queue.stats.Pushed == queue.stats.Popped
+
+
+def test_buffer_policies():
+    for policy in ['drop-oldest', 'drop-newest', 'coalesce']:
+        buffer = Buffer(2, policy)
+        buffer.push('Disconnect', keep=True)
+        buffer.push('a')
+        buffer.push('b')
+        buffer.push('c')
+        assert 'Disconnect' in [item for _, item, _ in buffer.items]
+
+    buffer = Buffer(3, 'coalesce')
+    for item, key in [('a', 'Clients'), ('b', 'Pointer'), ('c', 'Windows'), ('d', 'Clients')]:
+        buffer.push(item, key)
+    assert [buffer.pop() for _ in range(3)] == ['d', 'b', 'c']
+    assert buffer.stats.Coalesced == 1
+
+
+def test_record_replay(ct, simulator, tmp_path):
+    path = str(tmp_path / 'events.jsonl.gz')
+    events = []
+    recorder = ct.record(path)
+    ct.listen(events.append)
+    firefox = simulator.spawn('firefox')
+    simulator.point(10, 10)
+    simulator.kill(firefox)
+    simulator.flush()
+    ct.close()
+    with gzip.open(path, 'rb') as file:
+        lines = [json.loads(line) for line in file]
+    assert recorder.stats.Lines == len(lines) == len(events)
+
+    replay = Replay(path, speed=None)
+    replayed = Cortile(connector=Connector(session=replay))
+    received = []
+    assert replayed.desktop_switch(1)
+    assert replay.calls == [['DesktopSwitch', 1]]
+    replayed.listen(received.append)
+    replayed.wait()
+    assert [(event.Type, event.Name) for event in received] == [(event.Type, event.Name) for event in events]